@@ -0,0 +1,300 @@
+from __future__ import annotations
+from dataclasses import dataclass
+
+@dataclass
+class No:
+    esquerda: Arvore
+    valor: int
+    direita: Arvore
+    # A altura da subárvore com raiz neste nó (0 para uma folha)
+    altura: int = 0
+    # A quantidade de nós da subárvore com raiz neste nó
+    tamanho: int = 1
+    # A quantidade de nós com grau 2 da subárvore com raiz neste nó
+    grau2: int = 0
+
+Arvore = No | None
+
+def altura(t: Arvore) -> int:
+    '''
+    Devolve a altura da árvore *t*, isto é, o comprimento do caminho mais
+    longo da raiz até uma folha. A altura da árvore vazia é -1.
+
+    Exemplos:
+    >>> altura(None)
+    -1
+    >>> altura(No(None, 3, None))
+    0
+    '''
+    if t is None:
+        return -1
+    else:
+        return t.altura
+
+def qnt_elementos(t: Arvore) -> int:
+    '''
+    Devolve a quantidade de elementos da árvore *t*.
+
+    Exemplos:
+    >>> t = None
+    >>> qnt_elementos(t)
+    0
+    >>> for v in [3, 19, 32, 1, 12]:
+    ...     t = insere(t, v)
+    >>> qnt_elementos(t)
+    5
+    '''
+    if t is None:
+        return 0
+    else:
+        return t.tamanho
+
+def qnt_grau2(t: Arvore) -> int:
+    '''
+    Devolve a quantidade de nós na árvore *t* que possuem dois filhos.
+
+    Exemplos:
+    >>> t = None
+    >>> qnt_grau2(t)
+    0
+    >>> for v in [3, 19, 32, 1, 12]:
+    ...     t = insere(t, v)
+    >>> qnt_grau2(t)
+    2
+    '''
+    if t is None:
+        return 0
+    else:
+        return t.grau2
+
+def k_esimo(t: Arvore, k: int) -> int:
+    '''
+    Devolve o *k*-ésimo menor valor da árvore *t* (o primeiro é o menor).
+
+    Requer que 1 <= k <= qnt_elementos(t).
+
+    Exemplos:
+    >>> t = None
+    >>> for v in [50, 20, 80, 10, 30]:
+    ...     t = insere(t, v)
+    >>> [k_esimo(t, k) for k in range(1, 6)]
+    [10, 20, 30, 50, 80]
+    >>> k_esimo(t, 6)
+    Traceback (most recent call last):
+    ...
+    ValueError: posição fora da faixa
+    '''
+    if not 1 <= k <= qnt_elementos(t):
+        raise ValueError('posição fora da faixa')
+    while t is not None:
+        esquerda = qnt_elementos(t.esquerda)
+        if k <= esquerda:
+            t = t.esquerda
+        elif k == esquerda + 1:
+            return t.valor
+        else:
+            k -= esquerda + 1
+            t = t.direita
+    raise AssertionError('tamanhos inconsistentes')
+
+def posto(t: Arvore, valor: int) -> int:
+    '''
+    Devolve a quantidade de valores da árvore *t* que são menores que
+    *valor*. Se *valor* está em *t*, k_esimo(t, posto(t, valor) + 1) é
+    *valor*.
+
+    Exemplos:
+    >>> t = None
+    >>> for v in [50, 20, 80, 10, 30]:
+    ...     t = insere(t, v)
+    >>> posto(t, 30), posto(t, 31), posto(t, 5), posto(t, 100)
+    (2, 3, 0, 5)
+    '''
+    menores = 0
+    while t is not None:
+        if valor <= t.valor:
+            t = t.esquerda
+        else:
+            menores += qnt_elementos(t.esquerda) + 1
+            t = t.direita
+    return menores
+
+def insere(t: Arvore, valor: int) -> No:
+    '''
+    Devolve a raiz da AVL que é o resultado da inserção do *valor* em *t*.
+    Se o *valor* já está em *t*, devolve *t*.
+    Requer que *t* seja uma AVL.
+
+    Após a inserção, os nós no caminho até *valor* são rebalanceados com
+    rotações, de modo que a altura da árvore é sempre O(log n).
+
+    Exemplos:
+    >>> t = None
+    >>> for v in [1, 2, 3]:
+    ...     t = insere(t, v)
+    >>> t.valor, t.esquerda.valor, t.direita.valor
+    (2, 1, 3)
+    >>> for v in range(4, 1025):
+    ...     t = insere(t, v)
+    >>> altura(t)
+    10
+    >>> eh_avl(t)
+    True
+    '''
+    if t is None:
+        return No(None, valor, None)
+    elif valor < t.valor:
+        t.esquerda = insere(t.esquerda, valor)
+    elif valor > t.valor:
+        t.direita = insere(t.direita, valor)
+    else: # valor == t.valor
+        return t
+    return balanceia(t)
+
+def remove(t: Arvore, valor: int) -> Arvore:
+    '''
+    Devolve a raiz da AVL que é o resultado da remoção do *valor* de *t*.
+    Se o *valor* não está em *t*, devolve *t*.
+    Requer que *t* seja uma AVL.
+
+    Exemplos:
+    >>> t = None
+    >>> for v in range(100):
+    ...     t = insere(t, v)
+    >>> for v in range(0, 100, 3):
+    ...     t = remove(t, v)
+    >>> busca(t, 3), busca(t, 4)
+    (False, True)
+    >>> eh_avl(t)
+    True
+    >>> t = remove(t, 1000)
+    >>> eh_avl(t)
+    True
+    '''
+    if t is None:
+        return None
+    elif valor < t.valor:
+        t.esquerda = remove(t.esquerda, valor)
+    elif valor > t.valor:
+        t.direita = remove(t.direita, valor)
+    elif t.esquerda is None:
+        return t.direita
+    elif t.direita is None:
+        return t.esquerda
+    else:
+        # Substitui o valor pelo seu sucessor, que é removido da direita
+        sucessor = t.direita
+        while sucessor.esquerda is not None:
+            sucessor = sucessor.esquerda
+        t.valor = sucessor.valor
+        t.direita = remove(t.direita, sucessor.valor)
+    return balanceia(t)
+
+def busca(t: Arvore, valor: int) -> bool:
+    '''
+    Devolve True se *valor* está na AVL *t*, False caso contrário.
+
+    Exemplos:
+    >>> t = insere(insere(None, 5), 8)
+    >>> busca(t, 8), busca(t, 6)
+    (True, False)
+    '''
+    while t is not None and t.valor != valor:
+        if valor < t.valor:
+            t = t.esquerda
+        else:
+            t = t.direita
+    return t is not None
+
+def balanceia(t: No) -> No:
+    '''
+    Atualiza a altura de *t* e, se a diferença entre as alturas das
+    subárvores de *t* for maior que 1, aplica as rotações necessárias.
+    Devolve a nova raiz da subárvore.
+
+    Requer que as subárvores de *t* sejam AVLs com alturas que diferem de
+    no máximo 2.
+
+    Exemplos:
+    >>> t = No(None, 1, No(None, 2, No(None, 3, None)))
+    >>> t.direita.altura, t.direita.direita.altura = 1, 0
+    >>> t = balanceia(t)
+    >>> t.valor, t.altura
+    (2, 1)
+    '''
+    fator = altura(t.esquerda) - altura(t.direita)
+    if fator > 1:
+        assert t.esquerda is not None
+        if altura(t.esquerda.esquerda) < altura(t.esquerda.direita):
+            t.esquerda = rotaciona_esquerda(t.esquerda)
+        return rotaciona_direita(t)
+    elif fator < -1:
+        assert t.direita is not None
+        if altura(t.direita.direita) < altura(t.direita.esquerda):
+            t.direita = rotaciona_direita(t.direita)
+        return rotaciona_esquerda(t)
+    else:
+        atualiza(t)
+        return t
+
+def rotaciona_direita(t: No) -> No:
+    '''
+    Rotaciona *t* para a direita: o filho à esquerda de *t* passa a ser a
+    raiz e *t* passa a ser o seu filho à direita. Devolve a nova raiz.
+
+    Requer que *t* tenha filho à esquerda.
+    '''
+    e = t.esquerda
+    assert e is not None
+    t.esquerda = e.direita
+    e.direita = t
+    atualiza(t)
+    atualiza(e)
+    return e
+
+def rotaciona_esquerda(t: No) -> No:
+    '''
+    Rotaciona *t* para a esquerda: o filho à direita de *t* passa a ser a
+    raiz e *t* passa a ser o seu filho à esquerda. Devolve a nova raiz.
+
+    Requer que *t* tenha filho à direita.
+    '''
+    d = t.direita
+    assert d is not None
+    t.direita = d.esquerda
+    d.esquerda = t
+    atualiza(t)
+    atualiza(d)
+    return d
+
+def atualiza(t: No):
+    '''
+    Recalcula os campos de *t* que dependem das suas subárvores.
+    '''
+    t.altura = 1 + max(altura(t.esquerda), altura(t.direita))
+    t.tamanho = 1 + qnt_elementos(t.esquerda) + qnt_elementos(t.direita)
+    t.grau2 = qnt_grau2(t.esquerda) + qnt_grau2(t.direita)
+    if t.esquerda is not None and t.direita is not None:
+        t.grau2 += 1
+
+def eh_avl(t: Arvore) -> bool:
+    '''
+    Devolve True se as alturas, tamanhos e quantidades de nós de grau 2
+    armazenados em *t* estão corretos e as alturas das subárvores de cada nó
+    diferem de no máximo 1.
+
+    Exemplos:
+    >>> eh_avl(None)
+    True
+    >>> eh_avl(No(None, 1, No(None, 2, No(None, 3, None, 0), 1), 2))
+    False
+    '''
+    if t is None:
+        return True
+    else:
+        return eh_avl(t.esquerda) and eh_avl(t.direita) and \
+               abs(altura(t.esquerda) - altura(t.direita)) <= 1 and \
+               t.altura == 1 + max(altura(t.esquerda), altura(t.direita)) and \
+               t.tamanho == 1 + qnt_elementos(t.esquerda) + qnt_elementos(t.direita) and \
+               t.grau2 == qnt_grau2(t.esquerda) + qnt_grau2(t.direita) + \
+                   (t.esquerda is not None and t.direita is not None)
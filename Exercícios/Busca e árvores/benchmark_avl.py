@@ -0,0 +1,43 @@
+'''
+Mede a vazão de inserções e buscas na AVL com chaves em ordem crescente e
+em ordem aleatória.
+
+Uso: python benchmark_avl.py [quantidade de chaves]
+'''
+import random
+import sys
+import time
+from avl import altura, busca, insere
+
+
+def mede(nome: str, chaves: list[int]):
+    '''
+    Insere e depois busca todas as *chaves* e mostra as operações por
+    segundo de cada fase e a altura da árvore resultante.
+    '''
+    t = None
+    inicio = time.perf_counter()
+    for chave in chaves:
+        t = insere(t, chave)
+    insercao = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for chave in chaves:
+        busca(t, chave)
+    buscas = time.perf_counter() - inicio
+
+    n = len(chaves)
+    print(f'{nome:10} n={n}  altura={altura(t)}  '
+          f'insere={n / insercao:,.0f}/s  busca={n / buscas:,.0f}/s')
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    chaves = list(range(n))
+    mede('ordenadas', chaves)
+    random.shuffle(chaves)
+    mede('aleatórias', chaves)
+
+
+if __name__ == '__main__':
+    main()
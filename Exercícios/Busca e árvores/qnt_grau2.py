@@ -21,17 +21,49 @@ def insere(t: Arvore, valor: int) -> No:
     >>> r = insere(None, 10)
     >>> r
     No(esquerda=None, valor=10, direita=None)
+
+    Inserir valores em ordem produz uma árvore degenerada, mas nenhuma das
+    operações é recursiva
+    >>> for v in range(3000):
+    ...     r = insere(r, v)
+    >>> qnt_elementos(r)
+    3000
     '''
     if t is None:
         return No(None, valor, None)
-    else:
+    # Desce pela árvore até encontrar o valor ou a posição vazia em que ele
+    # deve ficar
+    atual = t
+    while atual.valor != valor:
+        if valor < atual.valor:
+            if atual.esquerda is None:
+                atual.esquerda = No(None, valor, None)
+            atual = atual.esquerda
+        else: # valor > atual.valor
+            if atual.direita is None:
+                atual.direita = No(None, valor, None)
+            atual = atual.direita
+    return t
+
+def busca(t: Arvore, valor: int) -> bool:
+    '''
+    Devolve True se *valor* está na ABB *t*, False caso contrário.
+
+    Exemplos:
+    >>> t = None
+    >>> busca(t, 3)
+    False
+    >>> for v in [5, 2, 8, 6]:
+    ...     t = insere(t, v)
+    >>> busca(t, 6), busca(t, 7)
+    (True, False)
+    '''
+    while t is not None and t.valor != valor:
         if valor < t.valor:
-            t.esquerda = insere(t.esquerda, valor)
-        elif valor > t.valor:
-            t.direita = insere(t.direita, valor)
-        else: # val == t.val
-            pass
-        return t
+            t = t.esquerda
+        else:
+            t = t.direita
+    return t is not None
 
 def qnt_elementos(t: Arvore) -> int:
     '''
@@ -51,10 +83,17 @@ def qnt_elementos(t: Arvore) -> int:
     >>> qnt_elementos(t)
     5
     '''
-    if t is None:
-        return 0
-    else:
-        return 1 + qnt_elementos(t.esquerda) + qnt_elementos(t.direita)
+    # Percorre a árvore usando uma pilha explícita com as subárvores que
+    # ainda não foram visitadas
+    quantidade = 0
+    pilha = [t]
+    while pilha:
+        no = pilha.pop()
+        if no is not None:
+            quantidade += 1
+            pilha.append(no.esquerda)
+            pilha.append(no.direita)
+    return quantidade
 
 def qnt_grau2(t: Arvore) -> int:
     '''
@@ -82,9 +121,15 @@ def qnt_grau2(t: Arvore) -> int:
     >>> qnt_grau2(t)
     3
     '''
-    if t is None:
-        return 0
-    elif t.esquerda is not None and t.direita is not None:
-        return 1 + qnt_grau2(t.esquerda) + qnt_grau2(t.direita)
-    else:
-        return qnt_grau2(t.esquerda) + qnt_grau2(t.direita)
+    # Percorre a árvore usando uma pilha explícita com as subárvores que
+    # ainda não foram visitadas
+    quantidade = 0
+    pilha = [t]
+    while pilha:
+        no = pilha.pop()
+        if no is not None:
+            if no.esquerda is not None and no.direita is not None:
+                quantidade += 1
+            pilha.append(no.esquerda)
+            pilha.append(no.direita)
+    return quantidade
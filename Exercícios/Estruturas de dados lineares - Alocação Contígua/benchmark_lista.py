@@ -0,0 +1,61 @@
+'''
+Compara o tempo das buscas em uma Lista com e sem o índice de valores.
+
+O cenário simula a remoção de duplicatas: cada valor de uma sequência é
+anexado à lista apenas se ainda não estiver nela e, no final, metade dos
+valores é removida com remove_item. Um segundo cenário usa uma lista
+circular como janela deslizante: a cada passo o primeiro item é removido,
+um novo item é anexado e a posição dele é buscada com indice.
+
+Uso: python benchmark_lista.py [quantidade de valores]
+'''
+import random
+import sys
+import time
+from lista import Lista
+
+
+def remove_duplicatas(valores: list[int], indexada: bool) -> tuple[float, float]:
+    '''
+    Devolve o tempo, em segundos, de cada uma das duas fases do cenário com
+    *valores*: a inserção sem duplicatas (contem e anexa) e a remoção
+    (contem e remove_item).
+    '''
+    inicio = time.perf_counter()
+    lst = Lista(indexada=indexada)
+    for valor in valores:
+        if not lst.contem(valor):
+            lst.anexa(valor)
+    meio = time.perf_counter()
+    for valor in valores[:len(valores) // 2]:
+        if lst.contem(valor):
+            lst.remove_item(valor)
+    return meio - inicio, time.perf_counter() - meio
+
+
+def janela_deslizante(valores: list[int], passos: int, indexada: bool) -> float:
+    '''
+    Devolve o tempo, em segundos, de *passos* passos da janela deslizante
+    sobre uma lista circular criada com *valores*.
+    '''
+    lst = Lista.de_iteravel(valores, circular=True, indexada=indexada)
+    inicio = time.perf_counter()
+    for i in range(passos):
+        lst.remove(0)
+        lst.anexa(valores[i % len(valores)])
+        lst.indice(valores[i % len(valores)])
+    return time.perf_counter() - inicio
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    valores = [random.randrange(n) for _ in range(n)]
+    for indexada in [False, True]:
+        insercao, remocao = remove_duplicatas(valores, indexada)
+        janela = janela_deslizante(valores, 2_000, indexada)
+        print(f'indexada={indexada!s:5}  n={n}  inserção {insercao:.3f} s  remoção {remocao:.3f} s'
+              f'  janela {janela:.3f} s')
+
+
+if __name__ == '__main__':
+    main()
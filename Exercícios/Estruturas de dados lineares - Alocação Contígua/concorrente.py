@@ -0,0 +1,244 @@
+'''
+Pilhas e filas de capacidade limitada que podem ser compartilhadas entre
+produtores e consumidores: inserir em uma estrutura cheia ou remover de uma
+estrutura vazia espera (sem consumir processador) até que a operação seja
+possível.
+
+As classes PilhaBloqueante e FilaBloqueante são para uso com threads; as
+classes PilhaAssincrona e FilaAssincrona são para uso com asyncio.
+'''
+import asyncio
+import threading
+from typing import Callable
+from fila import Fila
+from pilha import Pilha
+
+
+class _Bloqueante:
+    # Duas condições que compartilham a mesma trava: uma para esperar por
+    # espaço livre e outra para esperar por elementos
+    nao_cheia: threading.Condition
+    nao_vazia: threading.Condition
+
+    def __init__(self):
+        trava = threading.Lock()
+        self.nao_cheia = threading.Condition(trava)
+        self.nao_vazia = threading.Condition(trava)
+
+    def _insere(self, cheia: Callable[[], bool], insere: Callable[[], None], timeout: float | None):
+        # Espera até que cheia() seja False e executa insere()
+        with self.nao_cheia:
+            if not self.nao_cheia.wait_for(lambda: not cheia(), timeout):
+                raise TimeoutError('tempo esgotado esperando por espaço')
+            insere()
+            self.nao_vazia.notify()
+
+    def _remove(self, vazia: Callable[[], bool], remove: Callable[[], str], timeout: float | None) -> str:
+        # Espera até que vazia() seja False e devolve o resultado de remove()
+        with self.nao_vazia:
+            if not self.nao_vazia.wait_for(lambda: not vazia(), timeout):
+                raise TimeoutError('tempo esgotado esperando por um elemento')
+            item = remove()
+            self.nao_cheia.notify()
+            return item
+
+
+class PilhaBloqueante(_Bloqueante):
+    '''
+    Uma Pilha que pode ser usada por várias threads ao mesmo tempo.
+
+    Exemplos
+    >>> p = PilhaBloqueante(2)
+    >>> p.empilha('a')
+    >>> p.empilha('b')
+    >>> # A thread espera até que haja espaço na pilha
+    >>> t = threading.Thread(target=lambda: p.empilha('c'))
+    >>> t.start()
+    >>> p.desempilha()
+    'b'
+    >>> t.join()
+    >>> p.desempilha()
+    'c'
+    >>> p.desempilha(timeout=0.01)
+    'a'
+    >>> p.desempilha(timeout=0.01)
+    Traceback (most recent call last):
+    ...
+    TimeoutError: tempo esgotado esperando por um elemento
+    '''
+
+    pilha: Pilha
+
+    def __init__(self, capacidade: int):
+        super().__init__()
+        self.pilha = Pilha(capacidade)
+
+    def empilha(self, item: str, timeout: float | None = None):
+        '''
+        Adiciona o *item* na pilha, esperando até que haja espaço. Se a
+        espera demorar mais que *timeout* segundos, gera TimeoutError.
+        '''
+        self._insere(self.pilha.cheia, lambda: self.pilha.empilha(item), timeout)
+
+    def desempilha(self, timeout: float | None = None) -> str:
+        '''
+        Remove e devolve o elemento mais recentemente adicionado da pilha,
+        esperando até que a pilha não esteja vazia. Se a espera demorar mais
+        que *timeout* segundos, gera TimeoutError.
+        '''
+        return self._remove(self.pilha.vazia, self.pilha.desempilha, timeout)
+
+
+class FilaBloqueante(_Bloqueante):
+    '''
+    Uma Fila que pode ser usada por várias threads ao mesmo tempo.
+
+    Exemplos
+    >>> f = FilaBloqueante(4)
+    >>> produtor = threading.Thread(target=lambda: [f.enfileira(str(i)) for i in range(100)])
+    >>> produtor.start()
+    >>> [f.desenfileira() for _ in range(100)] == [str(i) for i in range(100)]
+    True
+    >>> produtor.join()
+    >>> f.enfileira('x')
+    >>> f.enfileira('y', timeout=0)
+    >>> f.desenfileira()
+    'x'
+    '''
+
+    fila: Fila
+
+    def __init__(self, capacidade: int):
+        super().__init__()
+        self.fila = Fila(capacidade)
+
+    def enfileira(self, item: str, timeout: float | None = None):
+        '''
+        Adiciona o *item* no final da fila, esperando até que haja espaço. Se
+        a espera demorar mais que *timeout* segundos, gera TimeoutError.
+        '''
+        self._insere(self.fila.cheia, lambda: self.fila.enfileira(item), timeout)
+
+    def desenfileira(self, timeout: float | None = None) -> str:
+        '''
+        Remove e devolve o elemento mais antigo da fila, esperando até que a
+        fila não esteja vazia. Se a espera demorar mais que *timeout*
+        segundos, gera TimeoutError.
+        '''
+        return self._remove(self.fila.vazia, self.fila.desenfileira, timeout)
+
+
+class _Assincrona:
+    # Duas condições que compartilham a mesma trava: uma para esperar por
+    # espaço livre e outra para esperar por elementos
+    nao_cheia: asyncio.Condition
+    nao_vazia: asyncio.Condition
+
+    def __init__(self):
+        trava = asyncio.Lock()
+        self.nao_cheia = asyncio.Condition(trava)
+        self.nao_vazia = asyncio.Condition(trava)
+
+    async def _insere(self, cheia: Callable[[], bool], insere: Callable[[], None], timeout: float | None):
+        # Espera até que cheia() seja False e executa insere()
+        async with self.nao_cheia:
+            try:
+                await asyncio.wait_for(self.nao_cheia.wait_for(lambda: not cheia()), timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError('tempo esgotado esperando por espaço') from None
+            insere()
+            self.nao_vazia.notify()
+
+    async def _remove(self, vazia: Callable[[], bool], remove: Callable[[], str], timeout: float | None) -> str:
+        # Espera até que vazia() seja False e devolve o resultado de remove()
+        async with self.nao_vazia:
+            try:
+                await asyncio.wait_for(self.nao_vazia.wait_for(lambda: not vazia()), timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError('tempo esgotado esperando por um elemento') from None
+            item = remove()
+            self.nao_cheia.notify()
+            return item
+
+
+class PilhaAssincrona(_Assincrona):
+    '''
+    Uma Pilha que pode ser usada por várias tarefas do asyncio.
+
+    Exemplos
+    >>> async def exemplo():
+    ...     p = PilhaAssincrona(1)
+    ...     produtor = asyncio.create_task(p.empilha('b'))
+    ...     await p.empilha('a')
+    ...     itens = [await p.desempilha(), await p.desempilha()]
+    ...     await produtor
+    ...     return sorted(itens)
+    >>> asyncio.run(exemplo())
+    ['a', 'b']
+    '''
+
+    pilha: Pilha
+
+    def __init__(self, capacidade: int):
+        super().__init__()
+        self.pilha = Pilha(capacidade)
+
+    async def empilha(self, item: str, timeout: float | None = None):
+        '''
+        Adiciona o *item* na pilha, esperando até que haja espaço. Se a
+        espera demorar mais que *timeout* segundos, gera TimeoutError.
+        '''
+        await self._insere(self.pilha.cheia, lambda: self.pilha.empilha(item), timeout)
+
+    async def desempilha(self, timeout: float | None = None) -> str:
+        '''
+        Remove e devolve o elemento mais recentemente adicionado da pilha,
+        esperando até que a pilha não esteja vazia. Se a espera demorar mais
+        que *timeout* segundos, gera TimeoutError.
+        '''
+        return await self._remove(self.pilha.vazia, self.pilha.desempilha, timeout)
+
+
+class FilaAssincrona(_Assincrona):
+    '''
+    Uma Fila que pode ser usada por várias tarefas do asyncio.
+
+    Exemplos
+    >>> async def exemplo():
+    ...     f = FilaAssincrona(2)
+    ...     async def produtor():
+    ...         for i in range(10):
+    ...             await f.enfileira(str(i))
+    ...     tarefa = asyncio.create_task(produtor())
+    ...     itens = [await f.desenfileira() for _ in range(10)]
+    ...     await tarefa
+    ...     try:
+    ...         await f.desenfileira(timeout=0.01)
+    ...     except TimeoutError as e:
+    ...         print(e)
+    ...     return itens
+    >>> asyncio.run(exemplo())
+    tempo esgotado esperando por um elemento
+    ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9']
+    '''
+
+    fila: Fila
+
+    def __init__(self, capacidade: int):
+        super().__init__()
+        self.fila = Fila(capacidade)
+
+    async def enfileira(self, item: str, timeout: float | None = None):
+        '''
+        Adiciona o *item* no final da fila, esperando até que haja espaço. Se
+        a espera demorar mais que *timeout* segundos, gera TimeoutError.
+        '''
+        await self._insere(self.fila.cheia, lambda: self.fila.enfileira(item), timeout)
+
+    async def desenfileira(self, timeout: float | None = None) -> str:
+        '''
+        Remove e devolve o elemento mais antigo da fila, esperando até que a
+        fila não esteja vazia. Se a espera demorar mais que *timeout*
+        segundos, gera TimeoutError.
+        '''
+        return await self._remove(self.fila.vazia, self.fila.desenfileira, timeout)
@@ -1,3 +1,12 @@
+import array as stdarray
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from itertools import compress
+from operator import countOf
 from typing import TypeVar, Iterator, Generic, overload, Union, Tuple
 
 T = TypeVar('T')
@@ -5,7 +14,8 @@ T = TypeVar('T')
 
 class array(Generic[T]):
     '''
-    Um arranjo de tamanho fixo implementado com uma lista.
+    Um arranjo de tamanho fixo implementado com uma lista ou, quando um
+    *typecode* é especificado, com um array.array compacto.
 
     Exemplos
     >>> a = array(5, 0)
@@ -34,20 +44,43 @@ class array(Generic[T]):
     ...    s = s + v
     >>> s
     'oi de novo oi'
+
+    Exemplo com armazenamento tipado
+    >>> a = array(4, 0, typecode='q')
+    >>> a[2] = 7
+    >>> a
+    array([0, 0, 7, 0], typecode='q')
+    >>> sum(a)
+    7
+    >>> a.memoryview().itemsize
+    8
     '''
 
-    valores: list[T]
+    valores: list[T] | stdarray.array | memoryview
+    # O código de tipo do módulo array da biblioteca padrão usado para
+    # armazenar os valores de forma compacta, ou None para usar uma lista
+    typecode: str | None
+    # A identificação (os.stat) do arquivo em que as alterações dos valores
+    # são gravadas, se o arranjo foi aberto com open_mmap no modo 'r+', ou
+    # None caso contrário
+    arquivo: os.stat_result | None
 
     @overload
-    def __init__(self, n_values: list[T]) -> None: ...
+    def __init__(self, n_values: list[T], *, typecode: str | None = None) -> None: ...
 
     @overload
-    def __init__(self, n_values: int, val: T) -> None: ...
+    def __init__(self, n_values: int, val: T, *, typecode: str | None = None) -> None: ...
 
-    def __init__(self, n_values: int | list[T], val: T | None = None) -> None:
+    def __init__(self, n_values: int | list[T], val: T | None = None, *, typecode: str | None = None) -> None:
         '''
         Cria um novo arranjo com *n* cópias de *val*.
 
+        Se *typecode* for especificado (por exemplo, 'q' para inteiros de 64
+        bits ou 'd' para números de ponto flutuante), os valores são
+        armazenados de forma contígua e compacta em um array.array, que
+        expõe o protocolo de buffer (veja o método memoryview). Nesse caso,
+        *val* precisa ser compatível com o *typecode*.
+
         Note que todas as cópias de *val* referenciam o mesmo objeto, o pode
         não ser o comportamento desejado.
 
@@ -81,82 +114,861 @@ class array(Generic[T]):
         >>> pontos[0].x = 10
         >>> pontos
         array([Ponto(x=10, y=4), Ponto(x=3, y=4)])
+
+        Com *typecode*, os valores precisam caber no tipo escolhido
+        >>> a = array([1, 2, 3], typecode='b')
+        >>> a[0] = 1000
+        Traceback (most recent call last):
+        ...
+        OverflowError: signed char is greater than maximum
         '''
+        self.typecode = typecode
+        self.arquivo = None
         if isinstance(n_values, int):
             assert val is not None
-            self.valores = [val] * n_values
+            if typecode is None:
+                self.valores = [val] * n_values
+            else:
+                self.valores = stdarray.array(typecode, [val]) * n_values
         else:
             assert val is None
-            self.valores = n_values[:]
+            if typecode is None:
+                self.valores = n_values[:]
+            else:
+                self.valores = stdarray.array(typecode, n_values)
 
     def __len__(self) -> int:
         return len(self.valores)
 
-    def __getitem__(self, i: int) -> T:
+    @overload
+    def __getitem__(self, i: int) -> T: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> 'array[T]': ...
+
+    def __getitem__(self, i: int | slice) -> 'T | array[T]':
+        '''
+        Devolve o valor na posição *i* ou, se *i* for uma fatia, um novo
+        arranjo com a cópia dos valores da fatia.
+
+        Exemplos
+        >>> a = array([1, 2, 3, 4, 5])
+        >>> a[1:4]
+        array([2, 3, 4])
+        >>> a[::2]
+        array([1, 3, 5])
+        >>> array([1, 2, 3], typecode='q')[1:]
+        array([2, 3], typecode='q')
+        '''
+        if isinstance(i, slice):
+            return array._de_valores(_copia(self.valores[i]), self.typecode)
         return self.valores[i]
 
-    def __setitem__(self, i: int, value: T):
-        self.valores[i] = value
+    def __setitem__(self, i: int | slice, value):
+        '''
+        Armazena *value* na posição *i*. Se *i* for uma fatia, *value* deve
+        ser um arranjo (ou iterável) com a mesma quantidade de valores da
+        fatia, pois o tamanho do arranjo não pode ser alterado.
+
+        Exemplos
+        >>> a = array(5, 0)
+        >>> a[1:3] = [7, 8]
+        >>> a
+        array([0, 7, 8, 0, 0])
+        >>> a[::2] = array([1, 1, 1])
+        >>> a
+        array([1, 7, 1, 0, 1])
+        >>> a[0:2] = [1, 2, 3]
+        Traceback (most recent call last):
+        ...
+        ValueError: a fatia possui 2 valores, mas foram atribuídos 3
+        '''
+        if isinstance(i, slice):
+            valores = self.__compativeis(value)
+            n = len(range(*i.indices(len(self.valores))))
+            if n != len(valores):
+                raise ValueError(f'a fatia possui {n} valores, mas foram atribuídos {len(valores)}')
+            self.valores[i] = valores
+        else:
+            self.valores[i] = value
 
     def __iter__(self) -> Iterator[T]:
         return iter(self.valores)
 
+    def fill(self, value: T, start: int = 0, stop: int | None = None):
+        '''
+        Armazena *value* em todas as posições de *start* até *stop*
+        (exclusive). Se *stop* for None, preenche até o fim do arranjo.
+
+        Exemplos
+        >>> a = array(6, 0)
+        >>> a.fill(3, 2)
+        >>> a
+        array([0, 0, 3, 3, 3, 3])
+        >>> a.fill(1, 1, 3)
+        >>> a
+        array([0, 1, 1, 3, 3, 3])
+        '''
+        start, stop, _ = slice(start, stop).indices(len(self.valores))
+        if start < stop:
+            self.valores[start:stop] = self.__repetidos(value, stop - start)
+
+    def copy_from(self, src: 'array[T]', src_start: int = 0, dst_start: int = 0, n: int | None = None):
+        '''
+        Copia *n* valores de *src*, a partir da posição *src_start*, para
+        este arranjo, a partir da posição *dst_start*. Se *n* for None, copia
+        todos os valores de *src* a partir de *src_start*.
+
+        *src* pode ser o próprio arranjo, mesmo que as regiões se sobreponham.
+
+        Exemplos
+        >>> a = array([1, 2, 3, 4, 5])
+        >>> b = array(7, 0)
+        >>> b.copy_from(a, 1, 3)
+        >>> b
+        array([0, 0, 0, 2, 3, 4, 5])
+        >>> b.copy_from(b, 3, 2, 2)
+        >>> b
+        array([0, 0, 2, 3, 3, 4, 5])
+        >>> b.copy_from(a, 0, 5)
+        Traceback (most recent call last):
+        ...
+        IndexError: cópia fora da faixa
+        '''
+        if n is None:
+            n = len(src.valores) - src_start
+        if n < 0 or src_start < 0 or dst_start < 0 or \
+           src_start + n > len(src.valores) or dst_start + n > len(self.valores):
+            raise IndexError('cópia fora da faixa')
+        if n > 0:
+            valores = self.__compativeis(src.valores[src_start:src_start + n])
+            self.valores[dst_start:dst_start + n] = valores
+
+    def sum(self) -> T:
+        '''
+        Devolve a soma dos valores do arranjo.
+
+        Exemplos
+        >>> array([1, 2, 3], typecode='q').sum()
+        6
+        '''
+        return sum(self.valores)
+
+    def count(self, value: T) -> int:
+        '''
+        Devolve a quantidade de posições do arranjo com valor igual a *value*.
+
+        Exemplos
+        >>> array([1, 0, 1, 1]).count(1)
+        3
+        '''
+        return countOf(self.valores, value)
+
+    def nonzero_indices(self) -> 'array[int]':
+        '''
+        Devolve um arranjo (com typecode 'q') com as posições, em ordem
+        crescente, dos valores diferentes de zero (verdadeiros).
+
+        Exemplos
+        >>> array([0, 3, 0, 0, 1]).nonzero_indices()
+        array([1, 4], typecode='q')
+        >>> array(3, 0).nonzero_indices()
+        array([], typecode='q')
+        '''
+        return array._de_valores(stdarray.array('q', compress(range(len(self.valores)), self.valores)), 'q')
+
+    @staticmethod
+    def _de_valores(valores, typecode: str | None) -> 'array':
+        # Cria um arranjo que usa *valores* diretamente, sem copiá-los
+        a: array = array.__new__(array)
+        a.valores = valores
+        a.typecode = typecode
+        a.arquivo = None
+        return a
+
+    def __repetidos(self, value: T, n: int):
+        # Devolve uma sequência compatível com valores com *n* cópias de *value*
+        if self.typecode is None:
+            return [value] * n
+        return stdarray.array(self.typecode, [value]) * n
+
+    def __compativeis(self, valores):
+        # Converte *valores* (um arranjo ou iterável) para o tipo usado em
+        # self.valores, para que possam ser atribuídos a uma fatia
+        if isinstance(valores, array):
+            valores = valores.valores
+        if self.typecode is None:
+            return valores if isinstance(valores, list) else list(valores)
+        if isinstance(valores, stdarray.array) and valores.typecode == self.typecode:
+            return valores
+        if isinstance(valores, memoryview) and valores.format == self.typecode:
+            # Uma fatia de array.array só aceita outro array.array
+            if isinstance(self.valores, memoryview):
+                return valores
+            return stdarray.array(self.typecode, valores.tobytes())
+        return stdarray.array(self.typecode, valores)
+
+    def save(self, path: str):
+        '''
+        Grava os valores do arranjo no arquivo *path*, em um formato binário
+        que pode ser mapeado em memória com array.open_mmap. Se o arranjo foi
+        aberto com array.open_mmap no modo 'r+' a partir do próprio *path*,
+        apenas grava as alterações (como flush) e continua mapeado no
+        arquivo.
+
+        Requer que o arranjo tenha sido criado com *typecode*.
+
+        Exemplos
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), 'a.bin')
+        >>> array([1, 2, 3], typecode='q').save(path)
+        >>> a = array.open_mmap(path, 'r+')
+        >>> a
+        array([1, 2, 3], typecode='q')
+        >>> a[0] = 10
+        >>> a.flush()
+        >>> array.open_mmap(path)
+        array([10, 2, 3], typecode='q')
+        >>> array.open_mmap(path)[0] = 5
+        Traceback (most recent call last):
+        ...
+        TypeError: cannot modify read-only memory
+        >>> b = array(4, 0, typecode='q')
+        >>> b.copy_from(array.open_mmap(path), 0, 1)
+        >>> b
+        array([0, 10, 2, 3], typecode='q')
+        >>> b[0:3] = array.open_mmap(path)
+        >>> b
+        array([10, 2, 3, 3], typecode='q')
+
+        O arranjo pode ser gravado no mesmo arquivo em que está mapeado
+        >>> a[1] = 20
+        >>> a.save(path)
+        >>> array.open_mmap(path)
+        array([10, 20, 3], typecode='q')
+        >>> a[2] = 30
+        >>> a.flush()
+        >>> array.open_mmap(path)
+        array([10, 20, 30], typecode='q')
+        >>> a.close()
+        '''
+        if self.typecode is None:
+            raise TypeError('o arranjo não possui typecode')
+        if _mapeado_em(self.arquivo, path):
+            self.flush()
+        else:
+            _salva(path, self.valores, self.typecode, (len(self.valores),))
+
+    @staticmethod
+    def open_mmap(path: str, mode: str = 'r') -> 'array':
+        '''
+        Devolve um arranjo cujos valores estão no arquivo *path* (gravado
+        com array.save) mapeado em memória. Nenhum valor é lido do arquivo
+        na criação do arranjo: as páginas são carregadas sob demanda e são
+        compartilhadas entre os processos que mapeiam o mesmo arquivo.
+
+        O *mode* pode ser 'r' (somente leitura), 'r+' (alterações são
+        gravadas no arquivo) ou 'c' (alterações ficam apenas na memória).
+        '''
+        valores, typecode, _, arquivo = _abre_mmap(path, mode, 1)
+        a = array._de_valores(valores, typecode)
+        a.arquivo = arquivo
+        return a
+
+    def flush(self):
+        '''
+        Grava no arquivo as alterações feitas em um arranjo aberto com
+        array.open_mmap no modo 'r+'. Não faz nada para outros arranjos.
+        '''
+        _flush(self.valores)
+
+    def close(self):
+        '''
+        Libera a visão dos valores e fecha o mapeamento de um arranjo aberto
+        com array.open_mmap. Depois disso, o arranjo não pode mais ser usado.
+        Não faz nada para outros arranjos. O arranjo também pode ser usado
+        com with, que chama close no final do bloco.
+
+        Requer que não existam outras visões (memoryview) dos valores.
+
+        Exemplos
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), 'a.bin')
+        >>> array([4, 5], typecode='q').save(path)
+        >>> with array.open_mmap(path) as a:
+        ...     a.sum()
+        9
+        >>> a[0]
+        Traceback (most recent call last):
+        ...
+        ValueError: operation forbidden on released memoryview object
+        '''
+        _fecha(self.valores)
+
+    def __enter__(self) -> 'array[T]':
+        return self
+
+    def __exit__(self, *excecao):
+        self.close()
+
+    def memoryview(self) -> memoryview:
+        '''
+        Devolve uma visão (sem cópia) dos valores do arranjo usando o
+        protocolo de buffer. A partir do Python 3.12, memoryview(a) também
+        funciona (veja __buffer__); nas versões anteriores, este método é a
+        única forma de acessar os valores sem cópia.
+
+        Requer que o arranjo tenha sido criado com *typecode*.
+
+        Exemplos
+        >>> a = array(3, 1.5, typecode='d')
+        >>> m = a.memoryview()
+        >>> m.format, m.itemsize, len(m)
+        ('d', 8, 3)
+        >>> m[1] = 4.0
+        >>> a
+        array([1.5, 4.0, 1.5], typecode='d')
+        >>> array(3, 0).memoryview()
+        Traceback (most recent call last):
+        ...
+        TypeError: o arranjo não possui typecode
+        '''
+        if self.typecode is None:
+            raise TypeError('o arranjo não possui typecode')
+        return memoryview(self.valores)
+
+    # Protocolo de buffer (PEP 688). Estes métodos só são usados a partir do
+    # Python 3.12; nas versões anteriores, memoryview(a) gera TypeError e é
+    # preciso usar a.memoryview()
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.memoryview()
+
+    def __release_buffer__(self, view: memoryview):
+        view.release()
+
     def __repr__(self) -> str:
-        return 'array(' + repr(self.valores) + ')'
+        if self.typecode is None:
+            return 'array(' + repr(self.valores) + ')'
+        return 'array(' + repr(self.valores.tolist()) + ', typecode=' + repr(self.typecode) + ')'
 
     def __str__(self) -> str:
-        return 'array(' + str(self.valores) + ')'
+        if self.typecode is None:
+            return 'array(' + str(self.valores) + ')'
+        return repr(self)
 
 
 class array2d(Generic[T]):
+    '''
+    Um arranjo bidimensional de tamanho fixo armazenado em um único arranjo
+    linear (em ordem de linhas).
+
+    Além do acesso a um elemento com a2[lin, col], é possível obter visões
+    (sem cópia) de uma linha com a2[lin], de uma coluna com a2[:, col] e de
+    uma região com a2[l0:l1, c0:c1]. Alterações feitas em uma visão são
+    refletidas no arranjo.
+
+    Exemplos
+    >>> a2 = array2d(3, 4, 0)
+    >>> a2[1, 2] = 5
+    >>> a2
+    array2d([[0, 0, 0, 0]
+             [0, 0, 5, 0]
+             [0, 0, 0, 0]])
+    >>> a2[1]
+    visao([0, 0, 5, 0])
+    >>> a2[:, 2]
+    visao([0, 5, 0])
+    >>> a2[0].fill(1)
+    >>> a2[:, 3].fill(9)
+    >>> a2[1:3, 0:2].fill(7)
+    >>> a2
+    array2d([[1, 1, 1, 9]
+             [7, 7, 5, 9]
+             [7, 7, 0, 9]])
+    >>> [sum(lin) for lin in a2.linhas()]
+    [12, 28, 23]
+    >>> a2[0:2, 1] = 4
+    >>> a2[:, 1]
+    visao([4, 4, 7])
+    '''
+
     lins: int
     cols: int
-    valores: list[T]
+    valores: list[T] | stdarray.array | memoryview
+    # O código de tipo usado para armazenar os valores de forma compacta
+    # (veja array), ou None para usar uma lista
+    typecode: str | None
+    # Veja array
+    arquivo: os.stat_result | None
 
     @overload
-    def __init__(self, lins_values: list[list[T]]): ...
+    def __init__(self, lins_values: list[list[T]], *, typecode: str | None = None): ...
 
     @overload
-    def __init__(self, lins_values: int, cols: int, val: T): ...
+    def __init__(self, lins_values: int, cols: int, val: T, *, typecode: str | None = None): ...
 
-    def __init__(self, lins_values: int | list[list[T]], cols: int | None = None, val: T | None = None):
+    def __init__(self, lins_values: int | list[list[T]], cols: int | None = None, val: T | None = None, *,
+                 typecode: str | None = None):
+        self.typecode = typecode
+        self.arquivo = None
         if isinstance(lins_values, int):
             assert cols is not None
             assert val is not None
             self.lins = lins_values
             self.cols = cols
-            self.valores = [val] * (self.lins * self.cols)
+            if typecode is None:
+                self.valores = [val] * (self.lins * self.cols)
+            else:
+                self.valores = stdarray.array(typecode, [val]) * (self.lins * self.cols)
         else:
             assert cols is None
             assert val is None
             self.lins = len(lins_values)
             self.cols = len(lins_values[0])
-            self.valores = []
+            self.valores = [] if typecode is None else stdarray.array(typecode)
             for lin in lins_values:
                 assert len(lin) == self.cols
-                for val in lin:
-                    self.valores.append(val)
+                self.valores.extend(lin)
+
+    @overload
+    def __getitem__(self, index: Tuple[int, int]) -> T: ...
+
+    @overload
+    def __getitem__(self, index: int | slice | Tuple[int | slice, int | slice]) -> 'visao[T] | visao2d[T]': ...
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            lin, col = index
+            if isinstance(lin, int) and isinstance(col, int):
+                assert lin < self.lins
+                assert col < self.cols
+                return self.valores[lin * self.cols + col]
+        return self.visao()[index]
+
+    def __setitem__(self, index, value: T):
+        if isinstance(index, tuple):
+            lin, col = index
+            if isinstance(lin, int) and isinstance(col, int):
+                assert lin < self.lins
+                assert col < self.cols
+                self.valores[lin * self.cols + col] = value
+                return
+        self.visao()[index] = value
+
+    def visao(self) -> 'visao2d[T]':
+        '''
+        Devolve uma visão (sem cópia) de todo o arranjo.
+        '''
+        return visao2d(self.valores, 0, self.lins, self.cols, self.cols, 1)
+
+    def linhas(self) -> Iterator['visao[T]']:
+        '''
+        Devolve um iterador com uma visão para cada linha do arranjo.
+        '''
+        return self.visao().linhas()
+
+    def save(self, path: str):
+        '''
+        Grava as dimensões e os valores do arranjo no arquivo *path*, em um
+        formato binário que pode ser mapeado em memória com
+        array2d.open_mmap. Veja array.save para um arranjo aberto com
+        array2d.open_mmap no modo 'r+'.
+
+        Requer que o arranjo tenha sido criado com *typecode*.
+
+        Exemplos
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), 'a2.bin')
+        >>> array2d([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], typecode='d').save(path)
+        >>> a2 = array2d.open_mmap(path, 'c')
+        >>> a2.lins, a2.cols
+        (3, 2)
+        >>> a2[2].fill(0.0)
+        >>> a2
+        array2d([[1.0, 2.0]
+                 [3.0, 4.0]
+                 [0.0, 0.0]])
+        >>> array2d.open_mmap(path)[2, 0]
+        5.0
+        >>> a2.save(path)
+        >>> a2.close()
+        >>> array2d.open_mmap(path)[2, 0]
+        0.0
+        >>> array.open_mmap(path)
+        Traceback (most recent call last):
+        ...
+        ValueError: o arquivo não contém um arranjo com 1 dimensão(ões)
+        >>> b2 = array2d.open_mmap(path, 'r+')
+        >>> b2.save(path)
+        >>> b2[0, 0] = 9.0
+        >>> b2.flush()
+        >>> array2d.open_mmap(path)[0, 0]
+        9.0
+        '''
+        if self.typecode is None:
+            raise TypeError('o arranjo não possui typecode')
+        if _mapeado_em(self.arquivo, path):
+            self.flush()
+        else:
+            _salva(path, self.valores, self.typecode, (self.lins, self.cols))
+
+    @staticmethod
+    def open_mmap(path: str, mode: str = 'r') -> 'array2d':
+        '''
+        Devolve um arranjo bidimensional cujos valores estão no arquivo
+        *path* (gravado com array2d.save) mapeado em memória. Veja
+        array.open_mmap para o significado de *mode*.
+        '''
+        valores, typecode, (lins, cols), arquivo = _abre_mmap(path, mode, 2)
+        a2: array2d = array2d.__new__(array2d)
+        a2.lins = lins
+        a2.cols = cols
+        a2.valores = valores
+        a2.typecode = typecode
+        a2.arquivo = arquivo
+        return a2
+
+    def flush(self):
+        '''
+        Grava no arquivo as alterações feitas em um arranjo aberto com
+        array2d.open_mmap no modo 'r+'. Não faz nada para outros arranjos.
+        '''
+        _flush(self.valores)
+
+    def close(self):
+        '''
+        Libera a visão dos valores e fecha o mapeamento de um arranjo aberto
+        com array2d.open_mmap. Veja array.close.
+        '''
+        _fecha(self.valores)
+
+    def __enter__(self) -> 'array2d[T]':
+        return self
+
+    def __exit__(self, *excecao):
+        self.close()
+
+    def __repr__(self) -> str:
+        return _repr2d('array2d', self.linhas())
+
+    def __str__(self) -> str:
+        return repr(self)
+
+
+class visao(Generic[T]):
+    '''
+    Uma visão unidimensional (sem cópia) de parte de um arranjo linear,
+    formada por *tamanho* posições a partir de *inicio*, separadas por
+    *passo* posições.
+
+    Exemplos
+    >>> a2 = array2d([[1, 2, 3], [4, 5, 6]])
+    >>> col = a2[:, 1]
+    >>> len(col)
+    2
+    >>> col[1]
+    5
+    >>> col[1] = 50
+    >>> list(col)
+    [2, 50]
+    >>> a2[1, 1]
+    50
+    >>> col[2]
+    Traceback (most recent call last):
+    ...
+    IndexError: índice fora da faixa
+    >>> grande = array2d(1000, 1000, 0, typecode='q')
+    >>> grande[999, 998] = 7
+    >>> sum(grande[:, 998])
+    7
+    '''
+
+    valores: list[T]
+    inicio: int
+    passo: int
+    tamanho: int
+
+    def __init__(self, valores, inicio: int, passo: int, tamanho: int):
+        self.valores = valores
+        self.inicio = inicio
+        self.passo = passo
+        self.tamanho = tamanho
+
+    def __len__(self) -> int:
+        return self.tamanho
+
+    def __posicao(self, i: int) -> int:
+        # Devolve a posição em valores do *i*-ésimo elemento da visão
+        if i < 0:
+            i += self.tamanho
+        if not 0 <= i < self.tamanho:
+            raise IndexError('índice fora da faixa')
+        return self.inicio + i * self.passo
+
+    def __getitem__(self, i: int) -> T:
+        return self.valores[self.__posicao(i)]
+
+    def __setitem__(self, i: int, value: T):
+        self.valores[self.__posicao(i)] = value
 
-    def __getitem__(self, index: Tuple[int, int]) -> T:
-        lin, col = index
-        assert lin < self.lins
-        assert col < self.cols
-        return self.valores[lin * self.cols + col]
+    def __fatia(self) -> slice:
+        # Devolve a fatia de valores que corresponde à visão
+        return slice(self.inicio, self.inicio + self.passo * self.tamanho, self.passo)
 
-    def __setitem__(self, index: Tuple[int, int], value: T):
-        lin, col = index
-        assert lin < self.lins
-        assert col < self.cols
-        self.valores[lin * self.cols + col] = value
+    def __iter__(self) -> Iterator[T]:
+        # Acessa diretamente as posições da visão, sem percorrer o arranjo
+        # desde o início
+        return map(self.valores.__getitem__, range(*self.__fatia().indices(len(self.valores))))
+
+    def fill(self, value: T):
+        '''
+        Armazena *value* em todas as posições da visão.
+        '''
+        self.valores[self.__fatia()] = _repetidos(self.valores, value, self.tamanho)
 
     def __repr__(self) -> str:
-        s = 'array2d(['
-        sep = ''
+        return 'visao(' + repr(list(self)) + ')'
+
+
+class visao2d(Generic[T]):
+    '''
+    Uma visão bidimensional (sem cópia) de parte de um arranjo linear, com
+    *lins* linhas e *cols* colunas. O elemento (lin, col) da visão está na
+    posição inicio + lin * passo_lin + col * passo_col de *valores*.
+
+    Exemplos
+    >>> a2 = array2d([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]])
+    >>> v = a2[1:, 1:3]
+    >>> v
+    visao2d([[6, 7]
+             [10, 11]])
+    >>> v[1, 0]
+    10
+    >>> v[1, 0] = 0
+    >>> a2[2, 1]
+    0
+    >>> v[:, 1]
+    visao([7, 11])
+    >>> a2[::2, ::3]
+    visao2d([[1, 4]
+             [9, 12]])
+
+    Atribuições com fatias armazenam o valor em todas as posições
+    selecionadas
+    >>> v = array2d([[1, 2], [3, 4]]).visao()
+    >>> v[0:2, 0] = 9
+    >>> v
+    visao2d([[9, 2]
+             [9, 4]])
+    >>> v[1] = 0
+    >>> v
+    visao2d([[9, 2]
+             [0, 0]])
+    >>> v[0, 'a'] = 1
+    Traceback (most recent call last):
+    ...
+    TypeError: o índice deve ser int ou slice
+    '''
+
+    valores: list[T]
+    inicio: int
+    lins: int
+    cols: int
+    passo_lin: int
+    passo_col: int
+
+    def __init__(self, valores, inicio: int, lins: int, cols: int, passo_lin: int, passo_col: int):
+        self.valores = valores
+        self.inicio = inicio
+        self.lins = lins
+        self.cols = cols
+        self.passo_lin = passo_lin
+        self.passo_col = passo_col
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            lin, col = index
+        else:
+            lin, col = index, slice(None)
+        l0, lpasso, nlins = _faixa(lin, self.lins)
+        c0, cpasso, ncols = _faixa(col, self.cols)
+        inicio = self.inicio + l0 * self.passo_lin + c0 * self.passo_col
+        if isinstance(lin, int) and isinstance(col, int):
+            return self.valores[inicio]
+        elif isinstance(lin, int):
+            return visao(self.valores, inicio, cpasso * self.passo_col, ncols)
+        elif isinstance(col, int):
+            return visao(self.valores, inicio, lpasso * self.passo_lin, nlins)
+        else:
+            return visao2d(self.valores, inicio, nlins, ncols,
+                           lpasso * self.passo_lin, cpasso * self.passo_col)
+
+    def __setitem__(self, index, value: T):
+        # Com fatias, *value* é armazenado em todas as posições selecionadas
+        if isinstance(index, tuple):
+            lin, col = index
+        else:
+            lin, col = index, slice(None)
+        if isinstance(lin, int) and isinstance(col, int):
+            l0, _, _ = _faixa(lin, self.lins)
+            c0, _, _ = _faixa(col, self.cols)
+            self.valores[self.inicio + l0 * self.passo_lin + c0 * self.passo_col] = value
+        else:
+            self[lin, col].fill(value)
+
+    def linha(self, lin: int) -> visao[T]:
+        '''
+        Devolve uma visão da linha *lin*.
+        '''
+        return self[lin]
+
+    def coluna(self, col: int) -> visao[T]:
+        '''
+        Devolve uma visão da coluna *col*.
+        '''
+        return self[:, col]
+
+    def linhas(self) -> Iterator[visao[T]]:
+        '''
+        Devolve um iterador com uma visão para cada linha.
+        '''
         for lin in range(self.lins):
-            i = lin * self.cols
-            s += sep + repr(self.valores[i:(i + self.cols)])
-            sep = '\n' + ' ' * 9
-        return s + '])'
+            yield visao(self.valores, self.inicio + lin * self.passo_lin, self.passo_col, self.cols)
+
+    def fill(self, value: T):
+        '''
+        Armazena *value* em todas as posições da visão.
+        '''
+        for lin in self.linhas():
+            lin.fill(value)
+
+    def __repr__(self) -> str:
+        return _repr2d('visao2d', self.linhas())
 
     def __str__(self) -> str:
         return repr(self)
+
+
+def _faixa(index: int | slice, n: int) -> Tuple[int, int, int]:
+    # Devolve o início, o passo e a quantidade de posições selecionadas por
+    # *index* em uma dimensão de tamanho *n*
+    if isinstance(index, int):
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError('índice fora da faixa')
+        return index, 1, 1
+    if not isinstance(index, slice):
+        raise TypeError('o índice deve ser int ou slice')
+    inicio, fim, passo = index.indices(n)
+    if passo < 0:
+        raise ValueError('passo negativo não suportado')
+    return inicio, passo, len(range(inicio, fim, passo))
+
+
+def _repr2d(nome: str, linhas: Iterator[visao]) -> str:
+    # Gera a representação de um arranjo bidimensional com uma linha por
+    # linha de texto
+    s = nome + '(['
+    sep = ''
+    for lin in linhas:
+        s += sep + repr(list(lin))
+        sep = '\n' + ' ' * (len(nome) + 2)
+    return s + '])'
+
+
+def _repetidos(valores, value, n: int):
+    # Devolve uma sequência do mesmo tipo de *valores* com *n* cópias de *value*
+    if isinstance(valores, list):
+        return [value] * n
+    if isinstance(valores, memoryview):
+        return stdarray.array(valores.format, [value]) * n
+    return stdarray.array(valores.typecode, [value]) * n
+
+
+def _copia(valores):
+    # Devolve *valores* ou, se *valores* for uma visão de um arquivo mapeado
+    # em memória, uma cópia em um array.array
+    if isinstance(valores, memoryview):
+        copia = stdarray.array(valores.format)
+        copia.frombytes(valores.tobytes())
+        return copia
+    return valores
+
+
+# Cabeçalho dos arquivos gravados por array.save e array2d.save: identificação,
+# typecode, ordem dos bytes, quantidade de dimensões e o tamanho de cada uma
+_CABECALHO = struct.Struct('<8sccB5xQQ')
+_IDENTIFICACAO = b'EDARRAY\x00'
+_ORDEM = b'<' if sys.byteorder == 'little' else b'>'
+_ACESSOS = {'r': mmap.ACCESS_READ, 'r+': mmap.ACCESS_WRITE, 'c': mmap.ACCESS_COPY}
+
+
+def _salva(path: str, valores, typecode: str, dims: Tuple[int, ...]):
+    # Grava o cabeçalho e os bytes de *valores* (sem cópia) no arquivo *path*.
+    # Como *valores* pode ser o mapeamento do próprio *path*, a gravação é
+    # feita em um arquivo temporário no mesmo diretório, que depois substitui
+    # *path*
+    lins, cols = dims if len(dims) == 2 else (dims[0], 0)
+    fd, temporario = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_CABECALHO.pack(_IDENTIFICACAO, typecode.encode(), _ORDEM, len(dims), lins, cols))
+            f.write(memoryview(valores).cast('B'))
+        if os.path.exists(path):
+            shutil.copymode(path, temporario)
+        os.replace(temporario, path)
+    except BaseException:
+        os.remove(temporario)
+        raise
+
+
+def _abre_mmap(path: str, mode: str, ndim: int) \
+        -> Tuple[memoryview, str, Tuple[int, ...], os.stat_result | None]:
+    # Mapeia o arquivo *path* em memória e devolve uma visão tipada dos
+    # valores, o typecode, as dimensões gravadas no cabeçalho e, no modo
+    # 'r+', a identificação do arquivo mapeado
+    if mode not in _ACESSOS:
+        raise ValueError(f'modo inválido: {mode!r}')
+    with open(path, 'r+b' if mode == 'r+' else 'rb') as f:
+        mapa = mmap.mmap(f.fileno(), 0, access=_ACESSOS[mode])
+        arquivo = os.fstat(f.fileno()) if mode == 'r+' else None
+    if len(mapa) < _CABECALHO.size:
+        raise ValueError('o arquivo não contém um arranjo')
+    identificacao, typecode, ordem, n, lins, cols = _CABECALHO.unpack_from(mapa)
+    if identificacao != _IDENTIFICACAO:
+        raise ValueError('o arquivo não contém um arranjo')
+    if ordem != _ORDEM:
+        raise ValueError('o arranjo foi gravado com outra ordem de bytes')
+    if n != ndim:
+        raise ValueError(f'o arquivo não contém um arranjo com {ndim} dimensão(ões)')
+    dims = (lins,) if ndim == 1 else (lins, cols)
+    tc = typecode.decode()
+    itemsize = stdarray.array(tc).itemsize
+    quantidade = lins if ndim == 1 else lins * cols
+    if len(mapa) != _CABECALHO.size + quantidade * itemsize:
+        raise ValueError('o tamanho do arquivo não corresponde ao arranjo')
+    return memoryview(mapa)[_CABECALHO.size:].cast(tc), tc, dims, arquivo
+
+
+def _mapeado_em(arquivo: os.stat_result | None, path: str) -> bool:
+    # Devolve True se *arquivo* (veja array.arquivo) é o arquivo *path*
+    try:
+        return arquivo is not None and os.path.samestat(arquivo, os.stat(path))
+    except FileNotFoundError:
+        return False
+
+
+def _fecha(valores):
+    # Libera a visão de um arquivo mapeado e fecha o mapeamento
+    if isinstance(valores, memoryview) and isinstance(valores.obj, mmap.mmap):
+        mapa = valores.obj
+        valores.release()
+        mapa.close()
+
+
+def _flush(valores):
+    # Grava no arquivo as alterações de uma visão de um arquivo mapeado
+    if isinstance(valores, memoryview) and isinstance(valores.obj, mmap.mmap) \
+       and not valores.readonly:
+        valores.obj.flush()
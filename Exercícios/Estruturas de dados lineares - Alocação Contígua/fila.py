@@ -0,0 +1,78 @@
+from ed import array
+
+class Fila:
+    '''
+    Uma coleção de strings que segue a política FIFO: o elemento menos
+    recentemente inserido é o primeiro a ser removido. Os elementos são
+    armazenados em um buffer circular de tamanho fixo.
+
+    >>> f = Fila(3)
+    >>> f.vazia()
+    True
+    >>> f.enfileira('a')
+    >>> f.enfileira('b')
+    >>> f.enfileira('c')
+    >>> f.cheia()
+    True
+    >>> f.desenfileira()
+    'a'
+    >>> f.enfileira('d')
+    >>> while not f.vazia():
+    ...     f.desenfileira()
+    'b'
+    'c'
+    'd'
+    '''
+
+    valores: array[str]
+    # O índice do elemento mais antigo da fila
+    inicio: int
+    # A quantidade de elementos na fila
+    tamanho: int
+
+    def __init__(self, capacidade: int):
+        self.valores = array(capacidade, '')
+        self.inicio = 0
+        self.tamanho = 0
+
+    def enfileira(self, item: str):
+        '''
+        Adiciona o *item* no final da fila.
+
+        Requer que a fila não esteja cheia.
+        '''
+        assert not self.cheia()
+        self.valores[(self.inicio + self.tamanho) % len(self.valores)] = item
+        self.tamanho = self.tamanho + 1
+
+    def desenfileira(self) -> str:
+        '''
+        Remove e devolve o elemento mais antigo da fila.
+
+        Requer que a fila não esteja vazia.
+        '''
+        assert not self.vazia()
+        item = self.valores[self.inicio]
+        # Libera a referência ao item desenfileirado
+        self.valores[self.inicio] = ''
+        self.inicio = (self.inicio + 1) % len(self.valores)
+        self.tamanho = self.tamanho - 1
+        return item
+
+    def vazia(self) -> bool:
+        '''
+        Devolve True se a fila está vazia, False caso contrário.
+        '''
+        return self.tamanho == 0
+
+    def cheia(self) -> bool:
+        '''
+        Devolve True se a fila está cheia, False caso contrário.
+        '''
+        return self.tamanho == len(self.valores)
+
+    def capacidade(self) -> int:
+        '''
+        Devolve a quantidade máxima de elementos que a fila armazena.
+        '''
+        return len(self.valores)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+from no import No, ReservaNos
+
+class FilaEncadeada:
+    '''
+    Uma coleção de números que segue a política FIFO, implementada com nós
+    encadeados. Os nós desenfileirados são devolvidos a uma ReservaNos e
+    reutilizados pelos próximos enfileiramentos.
+
+    Exemplos
+    >>> f = FilaEncadeada()
+    >>> f.vazia()
+    True
+    >>> f.enfileira(1)
+    >>> f.enfileira(2)
+    >>> f.desenfileira()
+    1
+    >>> f.enfileira(3)
+    >>> while not f.vazia():
+    ...     f.desenfileira()
+    2
+    3
+
+    Uma pilha e uma fila podem compartilhar a mesma reserva de nós
+    >>> from no import ReservaNos
+    >>> from pilha_encadeada import PilhaEncadeada
+    >>> r = ReservaNos()
+    >>> f = FilaEncadeada(r)
+    >>> p = PilhaEncadeada(r)
+    >>> f.enfileira(10)
+    >>> p.empilha(f.desenfileira())
+    >>> r.quantidade
+    0
+    '''
+
+    # O nó com o elemento mais antigo da fila
+    inicio: No | None
+    # O nó com o elemento mais recente da fila
+    fim: No | None
+    # A reserva de onde os nós são obtidos e para onde são devolvidos
+    reserva: ReservaNos
+
+    def __init__(self, reserva: ReservaNos | None = None):
+        '''
+        Cria uma fila vazia. Se *reserva* for especificada, os nós são
+        compartilhados com as outras estruturas que usam a mesma reserva.
+        '''
+        self.inicio = None
+        self.fim = None
+        self.reserva = ReservaNos() if reserva is None else reserva
+
+    def enfileira(self, item: int):
+        '''
+        Adiciona o *item* no final da fila.
+        '''
+        no = self.reserva.obtem(item, None)
+        if self.fim is None:
+            self.inicio = no
+        else:
+            self.fim.proximo = no
+        self.fim = no
+
+    def desenfileira(self) -> int:
+        '''
+        Remove e devolve o elemento mais antigo da fila.
+
+        Requer que a fila não esteja vazia.
+
+        Exemplos
+        >>> f = FilaEncadeada()
+        >>> f.desenfileira()
+        Traceback (most recent call last):
+        ...
+        ValueError: fila vazia
+        '''
+        no = self.inicio
+        if no is None:
+            raise ValueError('fila vazia')
+        self.inicio = no.proximo
+        if self.inicio is None:
+            self.fim = None
+        item = no.item
+        self.reserva.devolve(no)
+        return item
+
+    def vazia(self) -> bool:
+        '''
+        Devolve True se a fila está vazia, False caso contrário.
+        '''
+        return self.inicio is None
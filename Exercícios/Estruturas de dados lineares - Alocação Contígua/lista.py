@@ -1,3 +1,7 @@
+from __future__ import annotations
+from bisect import bisect_left, insort
+from itertools import chain
+from typing import Iterable, Iterator, TextIO
 from ed import array
 
 # Capacidade inicial alocada para a lista
@@ -6,6 +10,15 @@ CAPACIDADE_INICIAL = 4
 # Fator de crescimento quanto a lista precisa crescer
 FATOR_CRESCIMENTO = 2.0
 
+# A capacidade da lista é reduzida (pelo fator de crescimento) quando a
+# quantidade de itens fica menor ou igual a capacidade / LIMIAR_REDUCAO. Como
+# LIMIAR_REDUCAO > FATOR_CRESCIMENTO, uma sequência de inserções e remoções no
+# limite da capacidade não causa realocações sucessivas
+LIMIAR_REDUCAO = 4.0
+
+# Quantidade de itens convertidos e escritos de cada vez por Lista.escreve
+TAMANHO_BLOCO = 4096
+
 class Lista:
     '''
     Uma sequência de números.
@@ -42,15 +55,94 @@ class Lista:
     >>> lst.remove_item(5)
     >>> lst.str()
     '[10, 8, 8]'
+    >>> lst.anexa(3)
+    >>> lst.remove_ultimo()
+    3
+
+    Com armazenamento circular, inserções e remoções no início também não
+    precisam deslocar os demais itens
+    >>> lst = Lista(circular=True)
+    >>> for i in range(5):
+    ...     lst.insere(0, i)
+    >>> lst.str()
+    '[4, 3, 2, 1, 0]'
+    >>> lst.remove(0)
+    >>> lst.insere(4, 9)
+    >>> lst.str()
+    '[3, 2, 1, 0, 9]'
+
+    Com o índice de valores, as buscas não precisam percorrer a lista
+    >>> lst = Lista.de_iteravel([5, 7, 5, 9], indexada=True)
+    >>> lst.indice(5)
+    0
+    >>> lst.contem(8)
+    False
+    >>> lst.remove(0)
+    >>> lst.indice(5)
+    1
+    >>> lst.insere(0, 9)
+    >>> lst.indice(9), lst.indice(5)
+    (0, 2)
     '''
 
     valores: array[int]
     # A quantidade de valores que a lista está armazenando
     tamanho: int
+    # A capacidade mínima da lista
+    capacidade_inicial: int
+    # O fator pelo qual a capacidade é multiplicada (ou dividida) quando a
+    # lista cresce (ou diminui)
+    fator_crescimento: float
+    # Veja LIMIAR_REDUCAO. Se for None, a lista nunca diminui
+    limiar_reducao: float | None
+    # Se True, valores é usado como um buffer circular
+    circular: bool
+    # A posição em valores do primeiro item da lista (sempre 0 se a lista
+    # não for circular)
+    inicio: int
+    # Se a lista é indexada, as posições lógicas (em ordem crescente) das
+    # ocorrências de cada item da lista; None caso contrário
+    posicoes: dict[int, list[int]] | None
+    # A posição lógica do item de índice 0: o item de índice j está na
+    # posição lógica base + j. Assim, inserir ou remover no início da lista
+    # altera apenas base, sem mudar as posições lógicas dos demais itens
+    base: int
+
+    def __init__(self, capacidade: int = CAPACIDADE_INICIAL,
+                 fator_crescimento: float = FATOR_CRESCIMENTO,
+                 limiar_reducao: float | None = LIMIAR_REDUCAO,
+                 circular: bool = False, indexada: bool = False):
+        '''
+        Cria uma lista vazia com espaço para *capacidade* itens.
 
-    def __init__(self):
-        self.valores = array(100, 0)
+        Se *circular* for True, os itens são armazenados em um buffer
+        circular: inserir ou remover na posição i desloca apenas os itens
+        entre i e a extremidade mais próxima da lista, de modo que as
+        operações no início e no final são O(1) amortizado.
+
+        Se *indexada* for True, a lista mantém um dicionário com as posições
+        das ocorrências de cada item, o que torna contem e indice O(1), ao
+        custo de memória extra. Uma alteração na posição i atualiza apenas
+        as posições dos itens que estão do lado de i (início ou final) com
+        menos itens, de modo que as alterações nas extremidades da lista
+        mantêm o índice em O(1) (mais O(log k) para localizar a posição
+        entre as k ocorrências do item).
+
+        Requer que capacidade > 0, fator_crescimento > 1 e que
+        limiar_reducao seja None ou maior que fator_crescimento.
+        '''
+        assert capacidade > 0
+        assert fator_crescimento > 1
+        assert limiar_reducao is None or limiar_reducao > fator_crescimento
+        self.valores = array(capacidade, 0)
         self.tamanho = 0
+        self.capacidade_inicial = capacidade
+        self.fator_crescimento = fator_crescimento
+        self.limiar_reducao = limiar_reducao
+        self.circular = circular
+        self.inicio = 0
+        self.posicoes = {} if indexada else None
+        self.base = 0
 
     def num_itens(self) -> int:
         '''
@@ -58,6 +150,26 @@ class Lista:
         '''
         return self.tamanho
 
+    def capacidade(self) -> int:
+        '''
+        Devolve a quantidade de itens que a lista pode armazenar sem
+        precisar alocar um novo arranjo.
+
+        Exemplos:
+        >>> lst = Lista()
+        >>> lst.capacidade()
+        4
+        >>> for i in range(5):
+        ...     lst.anexa(i)
+        >>> lst.capacidade()
+        8
+        >>> for i in range(3):
+        ...     _ = lst.remove_ultimo()
+        >>> lst.capacidade()
+        4
+        '''
+        return len(self.valores)
+
     def get(self, i: int) -> int:
         '''
         Devolve o item que está na posição *i* da lista.
@@ -81,7 +193,7 @@ class Lista:
         ValueError: índice fora da faixa
         '''
         if 0 <= i < self.tamanho:
-            return self.valores[i]
+            return self.valores[self.__posicao(i)]
         else:
             raise ValueError('índice fora da faixa')
 
@@ -105,7 +217,9 @@ class Lista:
         ValueError: índice fora da faixa
         '''
         if 0 <= i < self.tamanho:
-            self.valores[i] = item
+            if self.posicoes is not None:
+                self.__indexa_troca(i, item)
+            self.valores[self.__posicao(i)] = item
         else:
             raise ValueError('índice fora da faixa')
 
@@ -140,14 +254,100 @@ class Lista:
         if i < 0 or self.num_itens() < i:
             raise ValueError('índice fora da faixa')
 
-        if self.num_itens() == len(self.valores):
+        if self.tamanho == len(self.valores):
             self.__cresce()
 
-        for j in range(self.tamanho, i, -1):
-            self.valores[j] = self.valores[j - 1]
-        self.valores[i] = item
+        if self.posicoes is not None:
+            self.__indexa_insercao(i, [item])
+        if self.circular and i < self.tamanho - i:
+            # Desloca os itens 0, 1, ..., i-1 uma posição para a esquerda
+            self.__desloca(0, -1, i)
+            self.inicio = self.__posicao(-1)
+        else:
+            # Desloca os itens i, i+1, ... uma posição para a direita
+            self.__desloca(i, i + 1, self.tamanho - i)
+        self.valores[self.__posicao(i)] = item
         self.tamanho += 1
 
+    def insere_varios(self, i: int, itens: Iterable[int]):
+        '''
+        Insere os *itens*, em ordem, a partir da posição *i* da lista. Os
+        itens que estavam inicialmente nas posições i, i+1, ..., passam a
+        ficar nas posições i+k, i+k+1, ..., onde k é a quantidade de itens
+        inseridos.
+
+        A capacidade é ajustada no máximo uma vez e os itens existentes são
+        deslocados uma única vez.
+
+        Requer que 0 <= i <= self.num_itens().
+
+        Exemplos:
+        >>> lst = Lista.de_iteravel([1, 2, 3])
+        >>> lst.insere_varios(1, range(7, 10))
+        >>> lst.str()
+        '[1, 7, 8, 9, 2, 3]'
+        >>> lst.insere_varios(7, [0])
+        Traceback (most recent call last):
+        ...
+        ValueError: índice fora da faixa
+        '''
+        if i < 0 or self.tamanho < i:
+            raise ValueError('índice fora da faixa')
+
+        novos = list(itens)
+        k = len(novos)
+        if self.tamanho + k > len(self.valores):
+            capacidade = len(self.valores)
+            self.__realoca(max(self.tamanho + k, int(capacidade * self.fator_crescimento)))
+
+        if self.posicoes is not None:
+            self.__indexa_insercao(i, novos)
+        if self.circular and i < self.tamanho - i:
+            # Desloca os itens 0, 1, ..., i-1 k posições para a esquerda
+            self.__desloca(0, -k, i)
+            self.inicio = self.__posicao(-k)
+        else:
+            # Desloca os itens i, i+1, ... k posições para a direita
+            self.__desloca(i, i + k, self.tamanho - i)
+        # Copia os novos itens, que podem ocupar duas partes contíguas de
+        # valores se a lista for circular
+        inicio = self.__posicao(i)
+        n = min(k, len(self.valores) - inicio)
+        self.valores[inicio:inicio + n] = novos[:n]
+        self.valores[0:k - n] = novos[n:]
+        self.tamanho += k
+
+    def estende(self, itens: Iterable[int]):
+        '''
+        Insere os *itens*, em ordem, no final da lista.
+
+        Exemplos:
+        >>> lst = Lista()
+        >>> lst.anexa(0)
+        >>> lst.estende(range(1, 6))
+        >>> lst.str()
+        '[0, 1, 2, 3, 4, 5]'
+        '''
+        self.insere_varios(self.tamanho, itens)
+
+    @staticmethod
+    def de_iteravel(itens: Iterable[int], circular: bool = False, indexada: bool = False) -> Lista:
+        '''
+        Cria uma nova lista com os *itens*, na ordem em que são produzidos.
+
+        Exemplos:
+        >>> lst = Lista.de_iteravel(range(1000))
+        >>> lst.num_itens()
+        1000
+        >>> lst.get(999)
+        999
+        >>> Lista.de_iteravel([], circular=True).str()
+        '[]'
+        '''
+        lst = Lista(circular=circular, indexada=indexada)
+        lst.estende(itens)
+        return lst
+
     def remove(self, i: int):
         '''
         Remove o item na posição *i* da lista. Os itens que estavam
@@ -170,12 +370,69 @@ class Lista:
         ValueError: índice fora da faixa
         '''
         if 0 <= i < self.tamanho:
-            for j in range(i + 1, self.tamanho):
-                self.valores[j - 1] = self.valores[j]
+            if self.posicoes is not None:
+                self.__indexa_remocao(i, self.valores[self.__posicao(i)])
+            if self.circular and i < self.tamanho - i - 1:
+                # Desloca os itens 0, 1, ..., i-1 uma posição para a direita
+                self.__desloca(0, 1, i)
+                self.inicio = self.__posicao(1)
+            else:
+                # Desloca os itens i+1, i+2, ... uma posição para a esquerda
+                self.__desloca(i + 1, i, self.tamanho - i - 1)
             self.tamanho -= 1
+            self.__reduz()
         else:
             raise ValueError('índice fora da faixa')
 
+    def anexa(self, item: int):
+        '''
+        Insere *item* no final da lista. É equivalente a
+        self.insere(self.num_itens(), item), mas não precisa deslocar itens.
+
+        Exemplos:
+        >>> lst = Lista()
+        >>> for i in range(6):
+        ...     lst.anexa(i)
+        >>> lst.str()
+        '[0, 1, 2, 3, 4, 5]'
+        '''
+        if self.tamanho == len(self.valores):
+            self.__cresce()
+        if self.posicoes is not None:
+            self.__indexa_insercao(self.tamanho, [item])
+        self.valores[self.__posicao(self.tamanho)] = item
+        self.tamanho += 1
+
+    def remove_ultimo(self) -> int:
+        '''
+        Remove e devolve o último item da lista.
+
+        Requer que a lista não esteja vazia.
+
+        Exemplos:
+        >>> lst = Lista()
+        >>> lst.anexa(1)
+        >>> lst.anexa(2)
+        >>> lst.remove_ultimo()
+        2
+        >>> lst.str()
+        '[1]'
+        >>> lst.remove_ultimo()
+        1
+        >>> lst.remove_ultimo()
+        Traceback (most recent call last):
+        ...
+        ValueError: lista vazia
+        '''
+        if self.tamanho == 0:
+            raise ValueError('lista vazia')
+        item = self.valores[self.__posicao(self.tamanho - 1)]
+        if self.posicoes is not None:
+            self.__indexa_remocao(self.tamanho - 1, item)
+        self.tamanho -= 1
+        self.__reduz()
+        return item
+
     def remove_item(self, item: int):
         '''
         Remove a primeira ocorrência de *item* da lista. Se i é a posição do
@@ -204,13 +461,49 @@ class Lista:
         Devolve a posição da primeira ocorrência de *item* na lista.
 
         Requer que *item* esteja na lista.
+
+        Exemplos:
+        >>> for indexada in [False, True]:
+        ...     lst = Lista.de_iteravel([4, 2, 4, 1], indexada=indexada)
+        ...     lst.set(0, 3)
+        ...     lst.insere(0, 1)
+        ...     print(lst.indice(4), lst.indice(1))
+        3 0
+        3 0
+        >>> lst.indice(5)
+        Traceback (most recent call last):
+        ...
+        ValueError: valor 5 não encontrado
         '''
-        for i in range(self.num_itens()):
-            if self.valores[i] == item:
-                return i
+        if self.posicoes is not None:
+            if item in self.posicoes:
+                return self.posicoes[item][0] - self.base
+        else:
+            for i in range(self.num_itens()):
+                if self.valores[self.__posicao(i)] == item:
+                    return i
         raise ValueError(f'valor {item} não encontrado')
 
-    def str(self) -> str:
+    def contem(self, item: int) -> bool:
+        '''
+        Devolve True se *item* está na lista, False caso contrário.
+
+        Exemplos:
+        >>> lst = Lista.de_iteravel([3, 1])
+        >>> lst.contem(1)
+        True
+        >>> lst.contem(2)
+        False
+        '''
+        if self.posicoes is not None:
+            return item in self.posicoes
+        try:
+            self.indice(item)
+            return True
+        except ValueError:
+            return False
+
+    def str(self, limite: int | None = None) -> str:
         '''
         Gera uma representação em string da lista.
 
@@ -227,20 +520,159 @@ class Lista:
         >>> lst.insere(2, 95)
         >>> lst.str()
         '[10, 540, 95]'
+
+        Se *limite* for especificado e a lista tiver mais que 2 * *limite*
+        itens, apenas os *limite* primeiros e os *limite* últimos são
+        representados.
+        >>> lst = Lista.de_iteravel(range(100))
+        >>> lst.str(3)
+        '[0, 1, 2, ..., 97, 98, 99]'
+        >>> lst.str(50) == lst.str()
+        True
         '''
-        if self.tamanho == 0:
-            return '[]'
-        string = '['
-        for i in range(0, self.tamanho - 1):
-            string = string + str(self.valores[i]) + ', '
-        string = string + str(self.valores[self.tamanho - 1]) + ']'
-        return string
+        if limite is None or self.tamanho <= 2 * limite:
+            return '[' + ', '.join(map(str, self.__itens(0, self.tamanho))) + ']'
+        itens = chain(map(str, self.__itens(0, limite)), ['...'],
+                      map(str, self.__itens(self.tamanho - limite, self.tamanho)))
+        return '[' + ', '.join(itens) + ']'
+
+    def escreve(self, arquivo: TextIO, tamanho_bloco: int = TAMANHO_BLOCO):
+        '''
+        Escreve em *arquivo* a mesma representação gerada por str(), mas
+        convertendo e escrevendo *tamanho_bloco* itens de cada vez, de modo
+        que a memória usada não depende do tamanho da lista.
+
+        Exemplos:
+        >>> import io
+        >>> arquivo = io.StringIO()
+        >>> lst = Lista.de_iteravel(range(10), circular=True)
+        >>> lst.insere(0, -1)
+        >>> lst.escreve(arquivo, tamanho_bloco=4)
+        >>> arquivo.getvalue() == lst.str()
+        True
+        >>> arquivo = io.StringIO()
+        >>> Lista().escreve(arquivo)
+        >>> arquivo.getvalue()
+        '[]'
+        '''
+        arquivo.write('[')
+        for inicio in range(0, self.tamanho, tamanho_bloco):
+            if inicio > 0:
+                arquivo.write(', ')
+            fim = min(inicio + tamanho_bloco, self.tamanho)
+            arquivo.write(', '.join(map(str, self.__itens(inicio, fim))))
+        arquivo.write(']')
+
+    def __itens(self, inicio: int, fim: int) -> Iterator[int]:
+        # Devolve um iterador para os itens com índices de *inicio* até *fim*
+        # (exclusive), que estão em até duas partes contíguas de valores
+        capacidade = len(self.valores)
+        i = self.__posicao(inicio)
+        n = fim - inicio
+        primeira = min(n, capacidade - i)
+        return chain(self.valores[i:i + primeira], self.valores[0:n - primeira])
     
     def __cresce(self):
-        # Aloca um novo arranjo para valores com a capacidade aumenta por *FATOR_CRESCIMENTO*
-        capacidade = int(len(self.valores) * FATOR_CRESCIMENTO)
+        # Aloca um novo arranjo para valores com a capacidade aumentada por
+        # fator_crescimento
+        capacidade = len(self.valores)
+        self.__realoca(max(capacidade + 1, int(capacidade * self.fator_crescimento)))
+
+    def __reduz(self):
+        # Aloca um novo arranjo para valores com a capacidade diminuída por
+        # fator_crescimento se a ocupação ficou abaixo do limiar de redução
+        capacidade = len(self.valores)
+        if self.limiar_reducao is not None and capacidade > self.capacidade_inicial and \
+           self.tamanho * self.limiar_reducao <= capacidade:
+            self.__realoca(max(self.capacidade_inicial, int(capacidade / self.fator_crescimento)))
+
+    def __realoca(self, capacidade: int):
+        # Move os itens para o início de um novo arranjo com a *capacidade*
+        # especificada
         valores = array(capacidade, 0)
-        for i in range(self.num_itens()):
-            valores[i] = self.valores[i]
+        # Os itens estão em até duas partes contíguas: do início até o fim de
+        # self.valores e do começo de self.valores em diante
+        n = min(self.tamanho, len(self.valores) - self.inicio)
+        valores.copy_from(self.valores, self.inicio, 0, n)
+        valores.copy_from(self.valores, 0, n, self.tamanho - n)
         self.valores = valores
+        self.inicio = 0
+
+    def __indexa_insercao(self, i: int, itens: list[int]):
+        # Atualiza o índice antes da inserção de *itens* na posição *i*
+        k = len(itens)
+        if i < self.tamanho - i:
+            # Os itens 0, 1, ..., i-1 passam a ter posições lógicas k menores
+            self.__desloca_indice(0, i, -k)
+            self.base -= k
+        else:
+            # Os itens i, i+1, ... mantêm as posições lógicas, mas ficam k
+            # posições depois
+            self.__desloca_indice(i, self.tamanho, k)
+        for p, item in enumerate(itens, self.base + i):
+            insort(self.posicoes.setdefault(item, []), p)
+
+    def __indexa_remocao(self, i: int, item: int):
+        # Atualiza o índice antes da remoção de *item* da posição *i*
+        self.__remove_posicao(item, self.base + i)
+        if i < self.tamanho - i - 1:
+            # Os itens 0, 1, ..., i-1 passam a ter posições lógicas 1 maiores
+            self.__desloca_indice(0, i, 1)
+            self.base += 1
+        else:
+            # Os itens i+1, i+2, ... passam a ter posições lógicas 1 menores
+            self.__desloca_indice(i + 1, self.tamanho, -1)
+
+    def __indexa_troca(self, i: int, item: int):
+        # Atualiza o índice antes da troca do item da posição *i* por *item*
+        antigo = self.valores[self.__posicao(i)]
+        if antigo != item:
+            self.__remove_posicao(antigo, self.base + i)
+            insort(self.posicoes.setdefault(item, []), self.base + i)
+
+    def __remove_posicao(self, item: int, p: int):
+        # Remove a posição lógica *p* das posições de *item*
+        posicoes = self.posicoes[item]
+        del posicoes[bisect_left(posicoes, p)]
+        if not posicoes:
+            del self.posicoes[item]
+
+    def __desloca_indice(self, inicio: int, fim: int, k: int):
+        # Soma *k* às posições lógicas dos itens de índices inicio, inicio+1,
+        # ..., fim-1. Os índices são percorridos no sentido do deslocamento
+        # para que as posições de cada item continuem em ordem crescente
+        indices = range(inicio, fim) if k < 0 else range(fim - 1, inicio - 1, -1)
+        for j in indices:
+            posicoes = self.posicoes[self.valores[self.__posicao(j)]]
+            posicoes[bisect_left(posicoes, self.base + j)] += k
+
+    def __posicao(self, i: int) -> int:
+        # Devolve a posição em valores do item de índice *i* (que pode estar
+        # fora da faixa 0..tamanho-1 durante os deslocamentos)
+        return (self.inicio + i) % len(self.valores)
+
+    def __desloca(self, origem: int, destino: int, n: int):
+        # Move os *n* itens a partir do índice *origem* para o índice
+        # *destino*, copiando cada parte contígua de uma vez. Se o destino
+        # está depois da origem, as partes são copiadas de trás para frente
+        # para não sobrescrever itens que ainda não foram copiados
+        capacidade = len(self.valores)
+        o = self.__posicao(origem)
+        d = self.__posicao(destino)
+        if destino < origem:
+            k = 0
+            while k < n:
+                so = (o + k) % capacidade
+                sd = (d + k) % capacidade
+                m = min(n - k, capacidade - so, capacidade - sd)
+                self.valores.copy_from(self.valores, so, sd, m)
+                k += m
+        else:
+            k = n
+            while k > 0:
+                fo = (o + k - 1) % capacidade + 1
+                fd = (d + k - 1) % capacidade + 1
+                m = min(k, fo, fd)
+                self.valores.copy_from(self.valores, fo - m, fd - m, m)
+                k -= m
 
@@ -0,0 +1,216 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import islice
+from operator import gt
+from typing import Iterable
+from ed import array
+
+# Capacidade inicial alocada para a lista
+CAPACIDADE_INICIAL = 4
+
+# Fator de crescimento quando a lista precisa crescer
+FATOR_CRESCIMENTO = 2.0
+
+class ListaOrdenada:
+    '''
+    Uma sequência de números em ordem não decrescente.
+
+    Exemplos
+    >>> lst = ListaOrdenada()
+    >>> lst.str()
+    '[]'
+    >>> for item in [20, 5, 12, 5, 30]:
+    ...     lst.insere_ordenado(item)
+    >>> lst.str()
+    '[5, 5, 12, 20, 30]'
+    >>> lst.busca(12)
+    2
+    >>> lst.conta_intervalo(5, 20)
+    4
+    >>> lst.remove_valor(5)
+    >>> lst.str()
+    '[5, 12, 20, 30]'
+    >>> lst.mescla([1, 13, 40])
+    >>> lst.str()
+    '[1, 5, 12, 13, 20, 30, 40]'
+    '''
+
+    valores: array[int]
+    # A quantidade de valores que a lista está armazenando
+    tamanho: int
+
+    def __init__(self):
+        self.valores = array(CAPACIDADE_INICIAL, 0)
+        self.tamanho = 0
+
+    def num_itens(self) -> int:
+        '''
+        Devolve a quantidade de itens da lista.
+        '''
+        return self.tamanho
+
+    def get(self, i: int) -> int:
+        '''
+        Devolve o item que está na posição *i* da lista.
+
+        Requer que 0 <= i < self.num_itens().
+
+        Exemplos:
+        >>> lst = ListaOrdenada()
+        >>> lst.mescla([3, 8])
+        >>> lst.get(1)
+        8
+        >>> lst.get(2)
+        Traceback (most recent call last):
+        ...
+        ValueError: índice fora da faixa
+        '''
+        if 0 <= i < self.tamanho:
+            return self.valores[i]
+        else:
+            raise ValueError('índice fora da faixa')
+
+    def insere_ordenado(self, item: int):
+        '''
+        Insere *item* na lista, depois dos itens menores ou iguais a ele.
+
+        Exemplos:
+        >>> lst = ListaOrdenada()
+        >>> for item in range(10, 0, -1):
+        ...     lst.insere_ordenado(item)
+        >>> lst.str()
+        '[1, 2, 3, 4, 5, 6, 7, 8, 9, 10]'
+        '''
+        if self.tamanho == len(self.valores):
+            self.__realoca(int(len(self.valores) * FATOR_CRESCIMENTO))
+        i = bisect_right(self.valores, item, 0, self.tamanho)
+        # Desloca os itens i, i+1, ... uma posição para a direita
+        self.valores.copy_from(self.valores, i, i + 1, self.tamanho - i)
+        self.valores[i] = item
+        self.tamanho += 1
+
+    def busca(self, item: int) -> int:
+        '''
+        Devolve a posição da primeira ocorrência de *item* na lista.
+
+        Requer que *item* esteja na lista.
+
+        Exemplos:
+        >>> lst = ListaOrdenada()
+        >>> lst.mescla([2, 4, 4, 6])
+        >>> lst.busca(4)
+        1
+        >>> lst.busca(5)
+        Traceback (most recent call last):
+        ...
+        ValueError: valor 5 não encontrado
+        '''
+        i = bisect_left(self.valores, item, 0, self.tamanho)
+        if i < self.tamanho and self.valores[i] == item:
+            return i
+        raise ValueError(f'valor {item} não encontrado')
+
+    def contem(self, item: int) -> bool:
+        '''
+        Devolve True se *item* está na lista, False caso contrário.
+
+        Exemplos:
+        >>> lst = ListaOrdenada()
+        >>> lst.mescla([2, 4])
+        >>> lst.contem(4), lst.contem(3)
+        (True, False)
+        '''
+        i = bisect_left(self.valores, item, 0, self.tamanho)
+        return i < self.tamanho and self.valores[i] == item
+
+    def conta_intervalo(self, inicio: int, fim: int) -> int:
+        '''
+        Devolve a quantidade de itens da lista que estão entre *inicio* e
+        *fim* (inclusive).
+
+        Exemplos:
+        >>> lst = ListaOrdenada()
+        >>> lst.mescla([1, 3, 3, 5, 8, 13])
+        >>> lst.conta_intervalo(3, 8)
+        4
+        >>> lst.conta_intervalo(9, 12)
+        0
+        >>> lst.conta_intervalo(8, 3)
+        0
+        '''
+        if fim < inicio:
+            return 0
+        return bisect_right(self.valores, fim, 0, self.tamanho) - \
+               bisect_left(self.valores, inicio, 0, self.tamanho)
+
+    def remove_valor(self, item: int):
+        '''
+        Remove a primeira ocorrência de *item* da lista.
+
+        Requer que *item* esteja na lista.
+
+        Exemplos:
+        >>> lst = ListaOrdenada()
+        >>> lst.mescla([1, 2, 3])
+        >>> lst.remove_valor(2)
+        >>> lst.str()
+        '[1, 3]'
+        >>> lst.remove_valor(2)
+        Traceback (most recent call last):
+        ...
+        ValueError: valor 2 não encontrado
+        '''
+        i = self.busca(item)
+        # Desloca os itens i+1, i+2, ... uma posição para a esquerda
+        self.valores.copy_from(self.valores, i + 1, i, self.tamanho - i - 1)
+        self.tamanho -= 1
+
+    def mescla(self, itens: Iterable[int]):
+        '''
+        Insere todos os *itens* na lista intercalando-os, em uma única
+        passagem, com os itens que já estão na lista.
+
+        Requer que *itens* esteja em ordem não decrescente. Caso contrário,
+        a lista não é alterada.
+
+        Exemplos:
+        >>> lst = ListaOrdenada()
+        >>> lst.mescla(range(0, 10, 2))
+        >>> lst.mescla(range(1, 10, 3))
+        >>> lst.str()
+        '[0, 1, 2, 4, 4, 6, 7, 8]'
+        >>> lst.mescla([5, 3])
+        Traceback (most recent call last):
+        ...
+        ValueError: itens fora de ordem
+        >>> lst.str()
+        '[0, 1, 2, 4, 4, 6, 7, 8]'
+        '''
+        mesclados = list(merge(islice(self.valores, 0, self.tamanho), itens))
+        # O merge mantém a ordem relativa dos itens, então um par de itens
+        # fora de ordem continua fora de ordem em mesclados
+        if any(map(gt, mesclados, islice(mesclados, 1, None))):
+            raise ValueError('itens fora de ordem')
+        if len(mesclados) > len(self.valores):
+            self.valores = array(max(len(mesclados), int(len(self.valores) * FATOR_CRESCIMENTO)), 0)
+        self.valores[0:len(mesclados)] = mesclados
+        self.tamanho = len(mesclados)
+
+    def str(self) -> str:
+        '''
+        Gera uma representação em string da lista.
+
+        Exemplos:
+        >>> lst = ListaOrdenada()
+        >>> lst.mescla([10, 540])
+        >>> lst.str()
+        '[10, 540]'
+        '''
+        return '[' + ', '.join([str(item) for item in islice(self.valores, 0, self.tamanho)]) + ']'
+
+    def __realoca(self, capacidade: int):
+        # Move os itens para um novo arranjo com a *capacidade* especificada
+        valores = array(capacidade, 0)
+        valores.copy_from(self.valores, 0, 0, self.tamanho)
+        self.valores = valores
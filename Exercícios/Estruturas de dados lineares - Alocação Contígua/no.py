@@ -1,7 +1,75 @@
 from __future__ import annotations
 from dataclasses import dataclass
 
-@dataclass
+# Quantidade máxima de nós livres mantidos por uma ReservaNos
+LIMITE_RESERVA = 1024
+
+@dataclass(slots=True)
 class No:
     item: int
     proximo: No | None
+
+class ReservaNos:
+    '''
+    Uma reserva de nós que não estão mais em uso, para que possam ser
+    reutilizados em vez de alocar novos nós. Os nós livres são encadeados
+    pelo campo proximo.
+
+    Exemplos
+    >>> r = ReservaNos()
+    >>> no = r.obtem(1, None)
+    >>> r.devolve(no)
+    >>> r.quantidade
+    1
+    >>> r.obtem(2, None) is no
+    True
+    >>> no
+    No(item=2, proximo=None)
+    '''
+
+    # O primeiro nó livre
+    livres: No | None
+    # A quantidade de nós livres
+    quantidade: int
+    # A quantidade máxima de nós livres; nós devolvidos com a reserva cheia
+    # são descartados
+    limite: int
+
+    def __init__(self, limite: int = LIMITE_RESERVA):
+        self.livres = None
+        self.quantidade = 0
+        self.limite = limite
+
+    def obtem(self, item: int, proximo: No | None) -> No:
+        '''
+        Devolve um nó com *item* e *proximo*, reutilizando um nó livre se
+        houver algum.
+        '''
+        no = self.livres
+        if no is None:
+            return No(item, proximo)
+        self.livres = no.proximo
+        self.quantidade -= 1
+        no.item = item
+        no.proximo = proximo
+        return no
+
+    def devolve(self, no: No):
+        '''
+        Adiciona *no* à reserva de nós livres.
+
+        Requer que *no* não seja mais usado por quem o devolveu.
+
+        Exemplos
+        >>> r = ReservaNos()
+        >>> no = r.obtem(12345, None)
+        >>> r.devolve(no)
+        >>> no.item
+        0
+        '''
+        # Libera a referência ao item que o nó armazenava
+        no.item = 0
+        if self.quantidade < self.limite:
+            no.proximo = self.livres
+            self.livres = no
+            self.quantidade += 1
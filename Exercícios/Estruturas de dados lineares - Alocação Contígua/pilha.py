@@ -1,5 +1,20 @@
+from __future__ import annotations
+import sys
+from typing import Iterable
 from ed import array
 
+# Capacidade inicial alocada para uma pilha criada sem capacidade
+CAPACIDADE_INICIAL = 4
+
+# Fator de crescimento quando a pilha precisa crescer
+FATOR_CRESCIMENTO = 2.0
+
+# A capacidade da pilha é reduzida (pelo fator de crescimento) quando a
+# quantidade de itens fica menor ou igual a capacidade / LIMIAR_REDUCAO. Como
+# LIMIAR_REDUCAO > FATOR_CRESCIMENTO, uma sequência de empilhamentos e
+# desempilhamentos no limite da capacidade não causa realocações sucessivas
+LIMIAR_REDUCAO = 4.0
+
 class Pilha:
     '''
     Uma coleção de strings que segue a política LIFO: o elemento mais
@@ -23,26 +38,79 @@ class Pilha:
     'fazer'
     'que'
     'O'
+
+    Uma pilha que cresce conforme necessário
+    >>> p = Pilha(cresce=True)
+    >>> for i in range(100):
+    ...     p.empilha(str(i))
+    >>> p.cheia()
+    False
+    >>> p.desempilha()
+    '99'
     '''
 
     valores: array[str]
     # O índice do elemento que está no topo da pilha
     topo: int
-    # A capacidade máxima de valores que a pilha armazena
+    # A capacidade máxima de valores que a pilha armazena (se a pilha cresce,
+    # a capacidade atual)
     capacidade_maxima: int
+    # A menor capacidade que a pilha pode ter ao reduzir: a capacidade com
+    # que foi criada ou a maior capacidade reservada
+    capacidade_minima: int
+    # Se True, a capacidade aumenta quando a pilha está cheia
+    cresce: bool
+    # Se True, a capacidade diminui quando a pilha fica pouco ocupada
+    reduz: bool
+
+    def __init__(self, capacidade: int | None = None, cresce: bool | None = None, reduz: bool = False):
+        '''
+        Cria uma pilha vazia com espaço para *capacidade* itens. Se a
+        *capacidade* não for informada, a pilha começa com CAPACIDADE_INICIAL
+        e, a menos que *cresce* seja False, cresce conforme necessário.
 
-    def __init__(self, capacidade: int):
+        Se *cresce* for True, a capacidade é multiplicada por
+        FATOR_CRESCIMENTO sempre que um item é empilhado em uma pilha sem
+        espaço, de modo que empilha é O(1) amortizado e a pilha nunca fica
+        cheia. Se *reduz* também for True, a capacidade é dividida por
+        FATOR_CRESCIMENTO (sem ficar menor que *capacidade* ou que a
+        capacidade reservada com reserva) quando a quantidade de itens fica
+        menor ou igual a capacidade / LIMIAR_REDUCAO.
+
+        Requer que capacidade > 0.
+
+        Exemplos
+        >>> p = Pilha()
+        >>> for i in range(10):
+        ...     p.empilha(str(i))
+        >>> p.capacidade() >= 10
+        True
+        >>> p = Pilha(cresce=False)
+        >>> p.capacidade() == CAPACIDADE_INICIAL
+        True
+        '''
+        if cresce is None:
+            cresce = capacidade is None
+        if capacidade is None:
+            capacidade = CAPACIDADE_INICIAL
+        assert capacidade > 0
+        assert cresce or not reduz
         self.capacidade_maxima = capacidade
+        self.capacidade_minima = capacidade
+        self.cresce = cresce
+        self.reduz = reduz
         self.valores = array(capacidade, '')
         self.topo = -1
 
     def empilha(self, item: str):
         '''
-        Adiciona o *item* na pilha.
+        Adiciona o *item* na pilha. Se a pilha cresce, a capacidade é
+        aumentada quando não há espaço para o *item*.
 
-        Requer que a quantidade de elementos
-        na pilha seja menor que MAX_TAM.
+        Se a pilha não cresce, requer que ela não esteja cheia.
         '''
+        if self.topo == self.capacidade_maxima - 1 and self.cresce:
+            self.__realoca(max(self.capacidade_maxima + 1, int(self.capacidade_maxima * FATOR_CRESCIMENTO)))
         assert self.topo < self.capacidade_maxima - 1
         self.topo = self.topo + 1
         self.valores[self.topo] = item
@@ -63,9 +131,85 @@ class Pilha:
         '''
         assert not self.vazia()
         item = self.valores[self.topo]
+        # Libera a referência ao item desempilhado
+        self.valores[self.topo] = ''
         self.topo = self.topo - 1
+        self.__reduz()
         return item
 
+    def empilha_varios(self, itens: Iterable[str]):
+        '''
+        Adiciona os *itens* na pilha, na ordem em que são produzidos, de
+        modo que o último item fica no topo.
+
+        Requer que a pilha tenha espaço para todos os itens.
+
+        Exemplos
+        >>> p = Pilha(5)
+        >>> p.empilha_varios(['a', 'b', 'c'])
+        >>> p.desempilha()
+        'c'
+        >>> p.empilha_varios('wxyz')
+        Traceback (most recent call last):
+        ...
+        AssertionError
+        '''
+        novos = list(itens)
+        n = self.topo + 1 + len(novos)
+        if n > self.capacidade_maxima and self.cresce:
+            self.__realoca(max(n, int(self.capacidade_maxima * FATOR_CRESCIMENTO)))
+        assert n <= self.capacidade_maxima
+        self.valores[self.topo + 1:n] = novos
+        self.topo = n - 1
+
+    def desempilha_varios(self, k: int) -> array[str]:
+        '''
+        Remove os *k* elementos mais recentemente adicionados da pilha e os
+        devolve em um arranjo, na ordem em que seriam devolvidos por *k*
+        chamadas de desempilha.
+
+        Requer que a pilha tenha pelo menos *k* elementos.
+
+        Exemplos
+        >>> p = Pilha(10)
+        >>> p.empilha_varios(['1', '+', '2', '*', '3'])
+        >>> p.desempilha_varios(3)
+        array(['3', '*', '2'])
+        >>> p.desempilha_varios(2)
+        array(['+', '1'])
+        >>> p.vazia()
+        True
+        '''
+        itens = self.topo_k(k)
+        # Libera as referências aos itens desempilhados
+        self.valores.fill('', self.topo - k + 1, self.topo + 1)
+        self.topo = self.topo - k
+        self.__reduz()
+        return itens
+
+    def topo_k(self, k: int) -> array[str]:
+        '''
+        Devolve, sem remover, os *k* elementos mais recentemente adicionados
+        da pilha, a partir do topo.
+
+        Requer que a pilha tenha pelo menos *k* elementos.
+
+        Exemplos
+        >>> p = Pilha(10)
+        >>> p.empilha_varios('abcd')
+        >>> p.topo_k(2)
+        array(['d', 'c'])
+        >>> p.topo_k(0)
+        array([])
+        >>> p.topo_k(5)
+        Traceback (most recent call last):
+        ...
+        AssertionError
+        '''
+        assert 0 <= k <= self.topo + 1
+        fim = self.topo - k
+        return self.valores[self.topo:fim if fim >= 0 else None:-1]
+
     def vazia(self) -> bool:
         '''
         Devolve True se a pilha está vazia, False caso contrário.
@@ -82,7 +226,8 @@ class Pilha:
 
     def cheia(self) -> bool:
         '''
-        Devolve True se a pilha está cheia, False caso contrário.
+        Devolve True se a pilha está cheia, False caso contrário. Uma pilha
+        que cresce nunca fica cheia.
 
         Exemplos
         >>> p = Pilha(100)
@@ -95,8 +240,13 @@ class Pilha:
         ...    p.empilha('lebre')
         >>> p.cheia()
         True
+        >>> p = Pilha()
+        >>> for i in range(CAPACIDADE_INICIAL):
+        ...    p.empilha('lebre')
+        >>> p.cheia()
+        False
         '''
-        return self.topo == self.capacidade_maxima - 1
+        return not self.cresce and self.topo == self.capacidade_maxima - 1
     
     def capacidade(self) -> int:
         '''
@@ -111,4 +261,69 @@ class Pilha:
         >>> p.capacidade()
         130
         '''
-        return self.capacidade_maxima
\ No newline at end of file
+        return self.capacidade_maxima
+
+    def reserva(self, n: int):
+        '''
+        Aumenta a capacidade da pilha, se necessário, para que ela possa
+        armazenar pelo menos *n* itens sem precisar de novas alocações. Se a
+        pilha reduz, a capacidade não fica menor que *n* ao desempilhar.
+
+        Requer que a pilha cresça.
+
+        Exemplos
+        >>> p = Pilha(cresce=True, reduz=True)
+        >>> p.reserva(1000)
+        >>> p.capacidade()
+        1000
+        >>> p.empilha('a')
+        >>> p.desempilha()
+        'a'
+        >>> p.capacidade()
+        1000
+        >>> p.reserva(10)
+        >>> p.capacidade()
+        1000
+        '''
+        assert self.cresce
+        self.capacidade_minima = max(self.capacidade_minima, n)
+        if n > self.capacidade_maxima:
+            self.__realoca(n)
+
+    def memoria(self) -> int:
+        '''
+        Devolve a quantidade de bytes ocupada pelo arranjo que armazena os
+        itens da pilha (sem contar a memória dos próprios itens).
+
+        Exemplos
+        >>> p = Pilha(cresce=True, reduz=True)
+        >>> vazia = p.memoria()
+        >>> for i in range(1000):
+        ...     p.empilha('x')
+        >>> p.memoria() > vazia
+        True
+        >>> while not p.vazia():
+        ...     _ = p.desempilha()
+        >>> p.memoria() == vazia
+        True
+        '''
+        return sys.getsizeof(self.valores) + sys.getsizeof(self.valores.valores)
+
+    def __reduz(self):
+        # Diminui a capacidade se a pilha reduz e ficou pouco ocupada. Depois
+        # de um desempilha_varios, pode ser preciso dividir a capacidade por
+        # FATOR_CRESCIMENTO mais de uma vez
+        if not self.reduz:
+            return
+        capacidade = self.capacidade_maxima
+        while capacidade > self.capacidade_minima and (self.topo + 1) * LIMIAR_REDUCAO <= capacidade:
+            capacidade = max(self.capacidade_minima, int(capacidade / FATOR_CRESCIMENTO))
+        if capacidade != self.capacidade_maxima:
+            self.__realoca(capacidade)
+
+    def __realoca(self, capacidade: int):
+        # Move os itens para um novo arranjo com a *capacidade* especificada
+        valores = array(capacidade, '')
+        valores.copy_from(self.valores, 0, 0, self.topo + 1)
+        self.valores = valores
+        self.capacidade_maxima = capacidade
\ No newline at end of file
@@ -0,0 +1,71 @@
+from __future__ import annotations
+from no import No, ReservaNos
+
+class PilhaEncadeada:
+    '''
+    Uma coleção de números que segue a política LIFO, implementada com nós
+    encadeados. Os nós desempilhados são devolvidos a uma ReservaNos e
+    reutilizados pelos próximos empilhamentos.
+
+    Exemplos
+    >>> p = PilhaEncadeada()
+    >>> p.vazia()
+    True
+    >>> p.empilha(1)
+    >>> p.empilha(2)
+    >>> p.empilha(3)
+    >>> p.desempilha()
+    3
+    >>> p.empilha(4)
+    >>> while not p.vazia():
+    ...     p.desempilha()
+    4
+    2
+    1
+    '''
+
+    # O nó com o elemento que está no topo da pilha
+    topo: No | None
+    # A reserva de onde os nós são obtidos e para onde são devolvidos
+    reserva: ReservaNos
+
+    def __init__(self, reserva: ReservaNos | None = None):
+        '''
+        Cria uma pilha vazia. Se *reserva* for especificada, os nós são
+        compartilhados com as outras estruturas que usam a mesma reserva.
+        '''
+        self.topo = None
+        self.reserva = ReservaNos() if reserva is None else reserva
+
+    def empilha(self, item: int):
+        '''
+        Adiciona o *item* na pilha.
+        '''
+        self.topo = self.reserva.obtem(item, self.topo)
+
+    def desempilha(self) -> int:
+        '''
+        Devolve o elemento mais recentemente adicionado da pilha.
+
+        Requer que a pilha não esteja vazia.
+
+        Exemplos
+        >>> p = PilhaEncadeada()
+        >>> p.desempilha()
+        Traceback (most recent call last):
+        ...
+        ValueError: pilha vazia
+        '''
+        no = self.topo
+        if no is None:
+            raise ValueError('pilha vazia')
+        self.topo = no.proximo
+        item = no.item
+        self.reserva.devolve(no)
+        return item
+
+    def vazia(self) -> bool:
+        '''
+        Devolve True se a pilha está vazia, False caso contrário.
+        '''
+        return self.topo is None
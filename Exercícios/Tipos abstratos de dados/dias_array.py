@@ -0,0 +1,90 @@
+from __future__ import annotations
+from array import array
+from collections import Counter
+from itertools import compress
+from typing import Iterable
+from dias_implementacao03 import Dia, Dias
+
+class DiasArray:
+    '''
+    Uma sequência de conjuntos de dias armazenada de forma colunar: cada
+    conjunto ocupa um byte (a sua máscara de bits) em um bytearray, sem um
+    objeto Dias por elemento.
+
+    As consultas percorrem o bytearray uma vez por meio de bytes.translate,
+    que mapeia cada máscara para 0 ou 1, e devolvem os índices selecionados
+    em um array de inteiros.
+
+    Exemplos
+    >>> ter_qui = Dias()
+    >>> ter_qui.alterna(Dia.TER)
+    >>> ter_qui.alterna(Dia.QUI)
+    >>> eventos = DiasArray([Dias(0b0010100), Dias(0b0111110), Dias(0b0000100), Dias(0)])
+    >>> eventos.filtra_contem(ter_qui)
+    array('q', [0, 1])
+    >>> eventos.intersecta(ter_qui)
+    array('q', [0, 1, 2])
+    >>> eventos.conta_por_dia()
+    [0, 1, 3, 1, 2, 1, 0]
+    >>> eventos[1].lista()
+    ['seg', 'ter', 'qua', 'qui', 'sex']
+    '''
+
+    # A máscara de bits de cada conjunto de dias
+    valores: bytearray
+
+    def __init__(self, dias: Iterable[Dias] = ()):
+        '''
+        Cria uma nova sequência com os conjuntos *dias*.
+        '''
+        self.valores = bytearray(d.mascara for d in dias)
+
+    def __len__(self) -> int:
+        return len(self.valores)
+
+    def __getitem__(self, i: int) -> Dias:
+        return Dias(self.valores[i])
+
+    def __setitem__(self, i: int, dias: Dias):
+        self.valores[i] = dias.mascara
+
+    def anexa(self, dias: Dias):
+        '''
+        Adiciona o conjunto *dias* no final da sequência.
+        '''
+        self.valores.append(dias.mascara)
+
+    def filtra_contem(self, dias: Dias) -> array[int]:
+        '''
+        Devolve os índices dos conjuntos que contêm todos os dias de *dias*.
+        '''
+        alvo = dias.mascara
+        return self.__seleciona(bytes(mascara & alvo == alvo for mascara in range(256)))
+
+    def intersecta(self, dias: Dias) -> array[int]:
+        '''
+        Devolve os índices dos conjuntos que contêm pelo menos um dos dias
+        de *dias*.
+        '''
+        alvo = dias.mascara
+        return self.__seleciona(bytes(mascara & alvo != 0 for mascara in range(256)))
+
+    def conta_por_dia(self) -> list[int]:
+        '''
+        Devolve uma lista com 7 elementos em que o elemento d.value é a
+        quantidade de conjuntos que contêm o dia d.
+        '''
+        # Conta as máscaras em uma única passagem e depois distribui a
+        # quantidade de cada máscara distinta entre os seus dias
+        contagens = [0] * 7
+        for mascara, quantidade in Counter(self.valores).items():
+            for dia in Dia:
+                if mascara >> dia.value & 1:
+                    contagens[dia.value] += quantidade
+        return contagens
+
+    def __seleciona(self, tabela: bytes) -> array[int]:
+        # Devolve os índices dos conjuntos cuja máscara é mapeada para 1 por
+        # *tabela*
+        selecionados = self.valores.translate(tabela)
+        return array('q', compress(range(len(selecionados)), selecionados))
@@ -0,0 +1,220 @@
+from __future__ import annotations
+from datetime import date, timedelta
+from enum import Enum
+from typing import Iterator
+
+class Dia(Enum):
+    '''
+    Um dia da semana.
+    '''
+    DOM = 0
+    SEG = 1
+    TER = 2
+    QUA = 3
+    QUI = 4
+    SEX = 5
+    SAB = 6
+
+ABREVIACOES = ('dom', 'seg', 'ter', 'qua', 'qui', 'sex', 'sab')
+
+# As abreviações dos dias de cada um dos 128 conjuntos possíveis, indexadas
+# pela máscara de bits do conjunto
+LISTAS = tuple(tuple(ABREVIACOES[i] for i in range(7) if mascara >> i & 1)
+               for mascara in range(128))
+
+# PROXIMO[mascara][d] é a quantidade de dias, a partir do dia da semana d
+# (inclusive), até o primeiro dia que está no conjunto com a *mascara*. Não é
+# usado para o conjunto vazio
+PROXIMO = tuple(tuple(next((k for k in range(7) if mascara >> (d + k) % 7 & 1), 0)
+                      for d in range(7))
+                for mascara in range(128))
+
+class Dias:
+    '''
+    Um conjunto de dias da semana que um evento deve se repetir.
+
+    O conjunto é armazenado em um único inteiro de 7 bits, em que o bit
+    d.value está ligado se e somente se o dia d está no conjunto. O hash de
+    um conjunto é a sua máscara, de modo que ele pode ser usado em sets e
+    como chave de dicionários, desde que não seja alterado depois disso.
+
+    Exemplos
+    >>> uteis = Dias()
+    >>> for d in [Dia.SEG, Dia.TER, Dia.QUA, Dia.QUI, Dia.SEX]:
+    ...     uteis.alterna(d)
+    >>> aulas = Dias()
+    >>> aulas.alterna(Dia.TER)
+    >>> aulas.alterna(Dia.SAB)
+    >>> (uteis | aulas).lista()
+    ['seg', 'ter', 'qua', 'qui', 'sex', 'sab']
+    >>> (uteis & aulas).lista()
+    ['ter']
+    >>> (aulas - uteis).lista()
+    ['sab']
+    >>> Dia.SAB in aulas, len(uteis)
+    (True, 5)
+    >>> len({Dias(0b0010100), Dias(0b0010100), aulas})
+    2
+    '''
+    __slots__ = ('mascara',)
+
+    # Os dias do conjunto, um bit por dia
+    mascara: int
+
+    def __init__(self, mascara: int = 0):
+        '''
+        Cria um novo conjunto de dias a partir da *mascara* de bits. Por
+        padrão, o conjunto é vazio.
+
+        Requer que 0 <= mascara < 128.
+
+        Exemplos
+        >>> c = Dias()
+        >>> c.lista()
+        []
+        >>> Dias(0b0100010).lista()
+        ['seg', 'sex']
+        '''
+        assert 0 <= mascara < 128
+        self.mascara = mascara
+
+    def alterna(self, d: Dia):
+        '''
+        Alterna a pertinencia do dia *d* em *self*, isto é, se *d* está em
+        *self*, *d* é removido. Se *d* não está em *self*, *d* é adicionado.
+
+        Exemplos
+        >>> c = Dias()
+        >>> c.alterna(Dia.SEX)
+        >>> c.lista()
+        ['sex']
+        >>> c.alterna(Dia.SEG)
+        >>> c.lista()
+        ['seg', 'sex']
+        >>> c.alterna(Dia.SEX)
+        >>> c.lista()
+        ['seg']
+        '''
+        self.mascara ^= 1 << d.value
+
+    def lista(self) -> list[str]:
+        '''
+        Devolve uma lista com os dias (abreviações) em ordem da semana que
+        estão em *self*.
+
+        Exemplos
+        >>> c = Dias()
+        >>> c.lista()
+        []
+        >>> c.alterna(Dia.TER)
+        >>> c.lista()
+        ['ter']
+        >>> c.alterna(Dia.DOM)
+        >>> c.lista()
+        ['dom', 'ter']
+        >>> c.alterna(Dia.QUI)
+        >>> c.alterna(Dia.SEG)
+        >>> c.alterna(Dia.SAB)
+        >>> c.alterna(Dia.QUA)
+        >>> c.alterna(Dia.SEX)
+        >>> c.lista()
+        ['dom', 'seg', 'ter', 'qua', 'qui', 'sex', 'sab']
+        '''
+        return list(LISTAS[self.mascara])
+
+    def ocorrencias(self, inicio: date, fim: date) -> Iterator[date]:
+        '''
+        Devolve um gerador com as datas de *inicio* até *fim* (inclusive) que
+        caem em algum dos dias de *self*. Cada data é obtida a partir da
+        anterior com um único salto, sem percorrer os dias intermediários.
+
+        Exemplos
+        >>> c = Dias()
+        >>> c.alterna(Dia.SEG)
+        >>> c.alterna(Dia.QUA)
+        >>> for d in c.ocorrencias(date(2024, 1, 1), date(2024, 1, 10)):
+        ...     print(d)
+        2024-01-01
+        2024-01-03
+        2024-01-08
+        2024-01-10
+        >>> list(Dias().ocorrencias(date(2024, 1, 1), date(2024, 12, 31)))
+        []
+        >>> list(Dias(1).ocorrencias(date(9999, 12, 25), date.max))
+        [datetime.date(9999, 12, 26)]
+        >>> list(Dias(0b0100000).ocorrencias(date(9999, 12, 25), date.max))
+        [datetime.date(9999, 12, 31)]
+        '''
+        if self.mascara == 0:
+            return
+        proximo = PROXIMO[self.mascara]
+        dia = dia_da_semana(inicio)
+        salto = proximo[dia]
+        atual = inicio
+        # O salto só é feito se não passar de *fim*, o que também evita
+        # ultrapassar date.max
+        while (fim - atual).days >= salto:
+            atual += timedelta(days=salto)
+            yield atual
+            dia = (dia + salto) % 7
+            salto = 1 + proximo[(dia + 1) % 7]
+
+    def conta_ocorrencias(self, inicio: date, fim: date) -> int:
+        '''
+        Devolve a quantidade de datas de *inicio* até *fim* (inclusive) que
+        caem em algum dos dias de *self*, sem gerar as datas.
+
+        Exemplos
+        >>> c = Dias()
+        >>> c.alterna(Dia.SEG)
+        >>> c.alterna(Dia.QUA)
+        >>> c.conta_ocorrencias(date(2024, 1, 1), date(2024, 1, 10))
+        4
+        >>> c.conta_ocorrencias(date(2000, 1, 1), date(2099, 12, 31))
+        10436
+        >>> c.conta_ocorrencias(date(2024, 1, 2), date(2024, 1, 1))
+        0
+        '''
+        n = (fim - inicio).days + 1
+        if n <= 0:
+            return 0
+        semanas, resto = divmod(n, 7)
+        # Os *resto* dias finais começam no mesmo dia da semana que *inicio*
+        janela = ((1 << resto) - 1) << dia_da_semana(inicio)
+        janela = (janela | janela >> 7) & 0b1111111
+        return semanas * len(self) + (self.mascara & janela).bit_count()
+
+    def __contains__(self, d: Dia) -> bool:
+        return self.mascara >> d.value & 1 == 1
+
+    def __len__(self) -> int:
+        return self.mascara.bit_count()
+
+    def __or__(self, outro: Dias) -> Dias:
+        return Dias(self.mascara | outro.mascara)
+
+    def __and__(self, outro: Dias) -> Dias:
+        return Dias(self.mascara & outro.mascara)
+
+    def __sub__(self, outro: Dias) -> Dias:
+        return Dias(self.mascara & ~outro.mascara)
+
+    def __eq__(self, outro: object) -> bool:
+        return isinstance(outro, Dias) and self.mascara == outro.mascara
+
+    def __hash__(self) -> int:
+        return self.mascara
+
+    def __repr__(self) -> str:
+        return 'Dias(' + repr(self.lista()) + ')'
+
+
+def dia_da_semana(d: date) -> int:
+    '''
+    Devolve o valor do Dia da semana da data *d*.
+
+    Exemplos
+    >>> Dia(dia_da_semana(date(2024, 1, 7)))
+    <Dia.DOM: 0>
+    '''
+    return (d.weekday() + 1) % 7
@@ -0,0 +1,49 @@
+'''
+Compara mesmos_elementos, que percorre as duas árvores em ordem ao mesmo
+tempo, com a verificação anterior, que contava os elementos das duas árvores
+e buscava cada elemento de uma árvore na outra.
+
+Uso: python benchmark_mesmos_elementos.py [quantidade de nós]
+'''
+import sys
+import time
+from trabalho import Arvore, No, cria_avl, estao_na_arvore, mesmos_elementos, qnt_elementos
+
+
+def mesmos_elementos_com_busca(t: Arvore, r: Arvore) -> bool:
+    '''
+    A implementação anterior de mesmos_elementos.
+    '''
+    return qnt_elementos(t) == qnt_elementos(r) and estao_na_arvore(t, r)
+
+
+def degenerada(n: int) -> Arvore:
+    '''
+    Cria uma árvore com os valores 0, 1, ..., n - 1 em que cada nó tem apenas
+    o filho à esquerda.
+    '''
+    r = None
+    for v in range(n):
+        r = No(r, v, None)
+    return r
+
+
+def mede(nome: str, f, t: Arvore, r: Arvore):
+    inicio = time.perf_counter()
+    resultado = f(t, r)
+    print(f'{nome:40} {resultado!s:5}  {time.perf_counter() - inicio:.3f} s')
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    t = cria_avl(list(range(n)))
+    r = cria_avl(list(range(n)))
+    mede('balanceadas, em ordem', mesmos_elementos, t, r)
+    mede('balanceadas, com busca', mesmos_elementos_com_busca, t, r)
+    # A implementação anterior é recursiva e não suporta árvores degeneradas
+    # com muitos nós
+    mede('balanceada e degenerada, em ordem', mesmos_elementos, t, degenerada(n))
+
+
+if __name__ == '__main__':
+    main()
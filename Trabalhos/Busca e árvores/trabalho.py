@@ -1,5 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from itertools import zip_longest
+from typing import Callable, Iterable, Iterator, Sequence
 
 @dataclass
 class No:
@@ -34,12 +36,16 @@ class No:
 Arvore = No | None
 
 
-def cria_avl(lista: list[int]) -> Arvore:
+def cria_avl(lista: Sequence[int]) -> Arvore:
     '''
     Cria uma Árvore Binária de Busca Balanceada (AVL) a partir
     de uma *lista* de inteiros.
     Requer que *lista* possua valores distintos em ordem crescente.
 
+    A *lista* pode ser qualquer sequência com len e acesso por índice (como
+    list, range ou ed.array). A árvore é construída sem copiar a entrada,
+    usando uma pilha de faixas de índices no lugar da recursão.
+
     Exemplos:
     >>> r = cria_avl([])
     >>> r
@@ -49,14 +55,102 @@ def cria_avl(lista: list[int]) -> Arvore:
     >>> r = cria_avl([1, 2, 3, 4, 5, 6])
     >>> r
     ((( 1 ) 2 ( 3 )) 4 (( 5 ) 6 ))
+    >>> cria_avl(range(1, 7))
+    ((( 1 ) 2 ( 3 )) 4 (( 5 ) 6 ))
     '''
-    if lista == []:
-        return None
-    else:
-        meio = (len(lista)) // 2
-        return No(cria_avl(lista[:meio]), lista[meio], cria_avl(lista[meio + 1:]))
+    raiz = None
+    # Cada item é uma faixa [ini, fim) da lista que ainda não foi construída,
+    # o nó pai da subárvore e o lado do pai em que ela deve ser ligada
+    pilha: list[tuple[int, int, No | None, str]] = [(0, len(lista), None, '')]
+    while pilha:
+        ini, fim, pai, lado = pilha.pop()
+        if ini == fim:
+            continue
+        meio = ini + (fim - ini) // 2
+        no = No(None, lista[meio], None)
+        if pai is None:
+            raiz = no
+        elif lado == 'esquerda':
+            pai.esquerda = no
+        else:
+            pai.direita = no
+        pilha.append((meio + 1, fim, no, 'direita'))
+        pilha.append((ini, meio, no, 'esquerda'))
+    return raiz
 
    
+def carrega_avl(valores: Iterable[int]) -> Arvore:
+    '''
+    Cria uma Árvore Binária de Busca Balanceada a partir de um iterável de
+    *valores*, de tamanho conhecido ou não, consumindo-o uma única vez.
+    Requer que *valores* estejam em ordem crescente e sejam distintos.
+
+    Os valores são encadeados pela direita (formando uma "vinha") à medida
+    que são lidos. Em seguida, a vinha é balanceada no lugar por rotações
+    (algoritmo Day-Stout-Warren), sem guardar os valores em uma lista. A
+    altura da árvore resultante é a mínima possível.
+
+    Exemplos:
+    >>> carrega_avl(iter([]))
+    >>> carrega_avl(iter([7]))
+    ( 7 )
+    >>> carrega_avl(x for x in range(1, 8))
+    ((( 1 ) 2 ( 3 )) 4 (( 5 ) 6 ( 7 )))
+    >>> t = carrega_avl(iter(range(1000)))
+    >>> altura(t), list(em_ordem(t)) == list(range(1000))
+    (9, True)
+    '''
+    # A pseudo raiz fica acima da vinha e simplifica as rotações da raiz
+    pseudo = No(None, 0, None)
+    ultimo = pseudo
+    n = 0
+    for valor in valores:
+        ultimo.direita = No(None, valor, None)
+        ultimo = ultimo.direita
+        n += 1
+    # m é a quantidade de nós da maior árvore completa com até n nós. As
+    # n - m primeiras rotações deixam os nós excedentes no último nível
+    m = (1 << (n + 1).bit_length() - 1) - 1
+    comprime(pseudo, n - m)
+    while m > 1:
+        m //= 2
+        comprime(pseudo, m)
+    return pseudo.direita
+
+
+def carrega_avl_arquivo(caminho: str) -> Arvore:
+    '''
+    Cria uma Árvore Binária de Busca Balanceada com os inteiros do arquivo
+    em *caminho*, um por linha, lendo o arquivo uma única vez. Linhas em
+    branco são ignoradas.
+    Requer que os inteiros estejam em ordem crescente e sejam distintos.
+    '''
+    with open(caminho) as arquivo:
+        return carrega_avl(int(linha) for linha in arquivo if not linha.isspace())
+
+
+def comprime(pseudo: No, k: int):
+    '''
+    Faz uma rotação à esquerda em cada um dos *k* primeiros nós ímpares da
+    vinha que está à direita de *pseudo*, de modo que os nós pares passam a
+    ser os pais dos nós ímpares.
+    Requer que a vinha tenha pelo menos 2 * k nós.
+
+    Exemplos:
+    >>> pseudo = No(None, 0, No(None, 1, No(None, 2, No(None, 3, None))))
+    >>> comprime(pseudo, 1)
+    >>> pseudo.direita
+    (( 1 ) 2 ( 3 ))
+    '''
+    no = pseudo
+    for _ in range(k):
+        filho = no.direita
+        no.direita = filho.direita
+        no = no.direita
+        filho.direita = no.esquerda
+        no.esquerda = filho
+
+
 def mesmos_elementos(t: Arvore, r: Arvore) -> bool:
     '''
     Retorna True caso as ABBs *t* e *r* possuam os mesmos elementos
@@ -90,10 +184,39 @@ def mesmos_elementos(t: Arvore, r: Arvore) -> bool:
     >>> mesmos_elementos(t, r)
     False
     '''
-    if qnt_elementos(t) != qnt_elementos(r):
-        return False
-    else:
-        return estao_na_arvore(t, r)
+    # Percorre as duas árvores em ordem ao mesmo tempo, parando na primeira
+    # diferença. Se uma das árvores acabar antes, o seu valor é None
+    for a, b in zip_longest(em_ordem(t), em_ordem(r)):
+        if a != b:
+            return False
+    return True
+
+
+def em_ordem(t: Arvore) -> Iterator[int]:
+    '''
+    Devolve um gerador com os valores da Árvore *t* em um percurso em ordem,
+    usando uma pilha explícita com no máximo altura(t) + 1 nós.
+
+    Exemplos:
+    >>> list(em_ordem(cria_avl([])))
+    []
+    >>> list(em_ordem(cria_avl([1, 2, 3, 4, 5, 6])))
+    [1, 2, 3, 4, 5, 6]
+    >>> r = No(None, 1, None)
+    >>> for v in range(2, 5000):
+    ...     r = No(r, v, None)
+    >>> sum(em_ordem(r))
+    12497500
+    '''
+    pilha: list[No] = []
+    while t is not None or pilha:
+        # Empilha o caminho até o menor valor ainda não visitado
+        while t is not None:
+            pilha.append(t)
+            t = t.esquerda
+        no = pilha.pop()
+        yield no.valor
+        t = no.direita
 
 
 def caminhos_maximos(t: Arvore) -> list[list]:
@@ -119,11 +242,40 @@ def caminhos_maximos(t: Arvore) -> list[list]:
     >>> caminhos_maximos(t)
     [[2, 8, 3, 4], [2, 3, 5, 2]]
     '''
-    caminhos_max = []
-    for caminho in caminhos(t):
-        if len(caminho) == altura(t) + 1:
-            caminhos_max.append(caminho)
-    return caminhos_max
+    alturas = alturas_dos_nos(t)
+    # Desce apenas pelos filhos cuja altura é uma unidade menor que a do pai,
+    # ou seja, apenas pelos nós que estão em algum caminho máximo
+    return list(_caminhos(t, lambda pai, filho: alturas[id(filho)] == alturas[id(pai)] - 1))
+
+
+def alturas_dos_nos(t: Arvore) -> dict[int, int]:
+    '''
+    Devolve um dicionário que associa o id de cada nó da Árvore *t* com a
+    altura da subárvore com raiz nesse nó. As alturas são calculadas de
+    baixo para cima em um único percurso pós-ordem com pilha explícita.
+
+    Exemplos:
+    >>> t = cria_avl([1, 2, 3, 4])
+    >>> alturas = alturas_dos_nos(t)
+    >>> alturas[id(t)], alturas[id(t.direita)]
+    (2, 0)
+    '''
+    alturas: dict[int, int] = {}
+    pilha: list[tuple[No, bool]] = [] if t is None else [(t, False)]
+    while pilha:
+        no, filhos_calculados = pilha.pop()
+        if filhos_calculados:
+            esquerda = -1 if no.esquerda is None else alturas[id(no.esquerda)]
+            direita = -1 if no.direita is None else alturas[id(no.direita)]
+            alturas[id(no)] = 1 + max(esquerda, direita)
+        else:
+            pilha.append((no, True))
+            if no.esquerda is not None:
+                pilha.append((no.esquerda, False))
+            if no.direita is not None:
+                pilha.append((no.direita, False))
+    return alturas
+
 
 def qnt_elementos(t: Arvore) -> int:
     '''
@@ -239,9 +391,12 @@ def altura(t: Arvore) -> int:
     else:
         return 1 + max(altura(t.esquerda), altura(t.direita))
     
-def caminhos(t: Arvore) -> list[list]:
+def caminhos(t: Arvore) -> Iterator[list[int]]:
     r'''
-    Encontra todos os caminhos da Árvore *t* partindo da raiz.
+    Devolve um gerador com todos os caminhos da Árvore *t* partindo da raiz
+    até uma folha, da esquerda para a direita. Os caminhos são produzidos sob
+    demanda a partir de uma única pilha, usando memória proporcional à
+    altura de *t*.
 
     Exemplos:
 
@@ -257,17 +412,33 @@ def caminhos(t: Arvore) -> list[list]:
     >>> dir = No(No(None, 7, None), 3, No(No(None, 2, None), 5, None))
     >>> t = No(esq, 2, dir)
     >>> r = cria_avl([])
-    >>> caminhos(r)
+    >>> list(caminhos(r))
     []
-    >>> caminhos(t)
+    >>> list(caminhos(t))
     [[2, 8, 3, 4], [2, 3, 7], [2, 3, 5, 2]]
+    >>> next(caminhos(t))
+    [2, 8, 3, 4]
     '''
-    if t is None:
-        return []
-    elif t.esquerda is None and t.direita is None:
-        return [[t.valor]]
-    else:
-        caminhos_dir_esq = caminhos(t.esquerda) + caminhos(t.direita)
-        for caminho in caminhos_dir_esq:  
-            caminho.insert(0, t.valor)
-        return caminhos_dir_esq
+    return _caminhos(t, lambda pai, filho: True)
+
+
+def _caminhos(t: Arvore, segue: Callable[[No, No], bool]) -> Iterator[list[int]]:
+    # Devolve um gerador com os caminhos da raiz de *t* até os nós sem filhos
+    # para os quais segue(pai, filho) é True, da esquerda para a direita.
+    # O caminho atual é mantido em uma única lista, que é cortada na
+    # profundidade do próximo nó a ser visitado e copiada no fim de cada
+    # caminho
+    caminho: list[int] = []
+    pilha: list[tuple[No, int]] = [] if t is None else [(t, 0)]
+    while pilha:
+        no, profundidade = pilha.pop()
+        del caminho[profundidade:]
+        caminho.append(no.valor)
+        # A direita é empilhada antes para que a esquerda seja visitada
+        # primeiro
+        filhos = [filho for filho in [no.direita, no.esquerda]
+                  if filho is not None and segue(no, filho)]
+        if not filhos:
+            yield caminho[:]
+        for filho in filhos:
+            pilha.append((filho, profundidade + 1))
@@ -136,13 +136,10 @@ class Colecao:
         >>> c.str_possuidas()
         '[1, 21, 33]'
         '''
-        string = '['
-        for i in range(len(self.figurinhas)):
-            if self.figurinhas[i] > 0:
-                string += str(i + 1) + ', '
-        if string[-1] != '[':
-            string = string[:-2]
-        return string + ']'
+        # As contagens nunca são negativas, então as posições diferentes de
+        # zero são exatamente as figurinhas possuídas
+        possuidas = self.figurinhas.nonzero_indices()
+        return '[' + ', '.join([str(i + 1) for i in possuidas]) + ']'
 
     def str_repetidas(self) -> str:
         '''